@@ -16,7 +16,7 @@ for i in b.get_immovables(type="round"):
     print(f"{i}: {i.name} pos: {i.pos} ({id(i)})")
 
 print("DISCARDING")
-b._immovables.discard(b.item(1, 9))
+del b._immovables[id(b.item(1, 9))]
 
 for i in b.get_immovables(type="round"):
     print(f"{i}: {i.name} pos: {i.pos} ({id(i)})")
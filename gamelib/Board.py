@@ -14,6 +14,49 @@ from gamelib.Movable import Movable
 from gamelib.Immovable import Immovable, Actionable
 from gamelib.Characters import Player, NPC
 import gamelib.Constants as Constants
+from operator import attrgetter
+import sys
+
+# The Board parameters that check_sanity() expects to be strings, in the order they
+# are checked.
+_STRING_PARAMETERS = (
+    "name",
+    "ui_border_bottom",
+    "ui_border_top",
+    "ui_border_left",
+    "ui_border_right",
+    "ui_board_void_cell",
+)
+
+# The (row, column) offsets of a one step move in each direction.
+_DIRECTION_DELTAS = {
+    Constants.UP: (-1, 0),
+    Constants.DOWN: (1, 0),
+    Constants.LEFT: (0, -1),
+    Constants.RIGHT: (0, 1),
+    Constants.DRUP: (-1, 1),
+    Constants.DRDOWN: (1, 1),
+    Constants.DLUP: (-1, -1),
+    Constants.DLDOWN: (1, -1),
+}
+
+# The Actionable permissions that allow players and NPCs to activate an Actionable.
+_PLAYER_PERMS = frozenset(
+    (Constants.PLAYER_AUTHORIZED, Constants.ALL_PLAYABLE_AUTHORIZED)
+)
+_NPC_PERMS = frozenset((Constants.NPC_AUTHORIZED, Constants.ALL_PLAYABLE_AUTHORIZED))
+
+
+def _filter_items(items, filters):
+    # Return the items for which every value of filters is contained in the
+    # attribute of the same name. The attribute getters are built once for the
+    # whole scan, and all() stops at the first filter that does not match.
+    probes = [(attrgetter(key), value) for key, value in filters.items()]
+    return [
+        item
+        for item in items
+        if all(value in getter(item) for getter, value in probes)
+    ]
 
 
 class Board:
@@ -97,12 +140,29 @@ class Board:
         except HacException as error:
             raise error
 
-        # Init the list of movable and immovable objects
-        self._movables = set()
-        self._immovables = set()
+        # Init the movable and immovable objects registries. They are dictionaries
+        # indexed by the id() of the items to keep them in insertion order.
+        self._movables = {}
+        self._immovables = {}
+        # Cache of the horizontal border lines, see _border_line()
+        self._border_lines = {}
         # If sanity check passed then, initialize the board
         self.init_board()
 
+    @property
+    def ui_board_void_cell(self):
+        """The string that represents an empty cell.
+
+        Setting it changes the model of all the void cells of the board. They are
+        updated the next time the board is displayed.
+        """
+        return self._ui_board_void_cell
+
+    @ui_board_void_cell.setter
+    def ui_board_void_cell(self, value):
+        self._ui_board_void_cell = value
+        self._void_dirty = True
+
     def __str__(self):
         return (
             "----------------\n"
@@ -125,14 +185,28 @@ class Board:
             myboard.init_board()
         """
 
+        generate_void_cell = self.generate_void_cell
         self._matrix = [
-            [
-                BoardItemVoid(model=self.ui_board_void_cell, parent=self)
-                for i in range(0, self.size[0], 1)
-            ]
+            [generate_void_cell() for i in range(0, self.size[0], 1)]
             for j in range(0, self.size[1], 1)
         ]
 
+    def generate_void_cell(self):
+        """This method return a void cell.
+
+        The void cell is a :class:`~gamelib.BoardItem.BoardItemVoid` that uses
+        ui_board_void_cell as model and this board as parent. It is used everywhere
+        the board needs to fill an empty cell.
+
+        :return: A void cell.
+        :rtype: :class:`~gamelib.BoardItem.BoardItemVoid`
+
+        Example::
+
+            myboard.place_item(myboard.generate_void_cell(), 2, 3)
+        """
+        return BoardItemVoid(model=self.ui_board_void_cell, parent=self)
+
     def init_cell(self, row, column):
         """
         Initialize a specific cell of the board with BoardItemVoid that
@@ -147,81 +221,34 @@ class Board:
 
             myboard.init_cell(2,3)
         """
-        self._matrix[row][column] = BoardItemVoid(
-            model=self.ui_board_void_cell, parent=self
-        )
+        self._matrix[row][column] = self.generate_void_cell()
 
     def check_sanity(self):
         """Check the board sanity.
 
         This is essentially an internal method called by the constructor.
         """
-        sanity_check = 0
-        if type(self.size) is list:
-            sanity_check += 1
-        else:
+        if type(self.size) is not list:
             raise HacException(
                 "SANITY_CHECK_KO", ("The 'size' parameter must be a list.")
             )
-        if len(self.size) == 2:
-            sanity_check += 1
-        else:
+        if len(self.size) != 2:
             raise HacException(
                 "SANITY_CHECK_KO",
                 ("The 'size' parameter must be a list of 2 elements."),
             )
-        if type(self.size[0]) is int:
-            sanity_check += 1
-        else:
-            raise HacException(
-                "SANITY_CHECK_KO",
-                ("The first element of the 'size' list must be an integer."),
-            )
-        if type(self.size[1]) is int:
-            sanity_check += 1
-        else:
-            raise HacException(
-                "SANITY_CHECK_KO",
-                ("The second element of the 'size' list must be an integer."),
-            )
-        if type(self.name) is str:
-            sanity_check += 1
-        else:
-            raise HacException(
-                "SANITY_CHECK_KO", "The 'name' parameter must be a string."
-            )
-        if type(self.ui_border_bottom) is str:
-            sanity_check += 1
-        else:
-            raise HacException(
-                "SANITY_CHECK_KO",
-                ("The 'ui_border_bottom' parameter must be a string."),
-            )
-        if type(self.ui_border_top) is str:
-            sanity_check += 1
-        else:
-            raise HacException(
-                "SANITY_CHECK_KO", ("The 'ui_border_top' parameter must be a string.")
-            )
-        if type(self.ui_border_left) is str:
-            sanity_check += 1
-        else:
-            raise HacException(
-                "SANITY_CHECK_KO", ("The 'ui_border_left' parameter must be a string.")
-            )
-        if type(self.ui_border_right) is str:
-            sanity_check += 1
-        else:
-            raise HacException(
-                "SANITY_CHECK_KO", ("The 'ui_border_right' parameter must be a string.")
-            )
-        if type(self.ui_board_void_cell) is str:
-            sanity_check += 1
-        else:
-            raise HacException(
-                "SANITY_CHECK_KO",
-                ("The 'ui_board_void_cell' parameter must be a string."),
-            )
+        for value, ordinal in zip(self.size, ("first", "second")):
+            if type(value) is not int:
+                raise HacException(
+                    "SANITY_CHECK_KO",
+                    f"The {ordinal} element of the 'size' list must be an integer.",
+                )
+        for attribute in _STRING_PARAMETERS:
+            if type(getattr(self, attribute)) is not str:
+                raise HacException(
+                    "SANITY_CHECK_KO",
+                    f"The '{attribute}' parameter must be a string.",
+                )
 
         if self.size[0] > 80:
             if self.DISPLAY_SIZE_WARNINGS:
@@ -243,13 +270,7 @@ class Board:
                     )
                 )
 
-        # If all sanity check clears return True else raise a general error.
-        # I have no idea how the general error could ever occur but...
-        # better safe than sorry!
-        if sanity_check == 10:
-            return True
-        else:
-            raise HacException("SANITY_CHECK_KO", "The board data are not valid.")
+        return True
 
     def display_around(self, object, row_radius, column_radius):
         """Display only a part of the board.
@@ -288,69 +309,52 @@ class Board:
         # a regular display()
         if self.size[1] <= 2 * row_radius and self.size[0] <= 2 * column_radius:
             return self.display()
-        row_min_bound = 0
-        row_max_bound = self.size[1]
-        column_min_bound = 0
-        column_max_bound = self.size[0]
-        # Row
-        if object.pos[0] - row_radius >= 0:
-            row_min_bound = object.pos[0] - row_radius
-        if object.pos[0] + row_radius < row_max_bound:
-            row_max_bound = object.pos[0] + row_radius
-        # Columns
-        if object.pos[1] - column_radius >= 0:
-            column_min_bound = object.pos[1] - column_radius
-        if object.pos[1] + column_radius < column_max_bound:
-            column_max_bound = object.pos[1] + column_radius
-        # Now adjust boundaries so it looks fine at min and max
-        if column_min_bound <= 0:
-            column_min_bound = 0
-            column_max_bound = 2 * column_radius
-        if column_max_bound >= self.size[0]:
-            column_max_bound = self.size[0]
-            if (self.size[0] - 2 * column_radius) >= 0:
-                column_min_bound = self.size[0] - 2 * column_radius
+        height = self.size[1]
+        width = self.size[0]
+        # Center the view on the object and then shift it so it looks fine at the
+        # edges of the board.
+        row_min_bound = object.pos[0] - row_radius
+        row_max_bound = object.pos[0] + row_radius
         if row_min_bound <= 0:
             row_min_bound = 0
             row_max_bound = 2 * row_radius
-        if row_max_bound >= self.size[1]:
-            row_max_bound = self.size[1]
-            if (self.size[1] - 2 * row_radius) >= 0:
-                row_min_bound = self.size[1] - 2 * row_radius
+        if row_max_bound >= height:
+            row_max_bound = height
+            if height >= 2 * row_radius:
+                row_min_bound = height - 2 * row_radius
+        column_min_bound = object.pos[1] - column_radius
+        column_max_bound = object.pos[1] + column_radius
+        if column_min_bound <= 0:
+            column_min_bound = 0
+            column_max_bound = 2 * column_radius
+        if column_max_bound >= width:
+            column_max_bound = width
+            if width >= 2 * column_radius:
+                column_min_bound = width - 2 * column_radius
+        # The left and right borders are only displayed if the view reaches them.
+        # Top and bottom borders are as large as the view, plus the corners.
+        left_border = self.ui_border_left if column_min_bound == 0 else ""
+        right_border = self.ui_border_right if column_max_bound == width else ""
+        border_size = (
+            column_max_bound
+            - column_min_bound
+            + (column_min_bound == 0)
+            + (column_max_bound == width)
+        )
+        if self._void_dirty:
+            self._update_void_cells()
+        frame = []
         if row_min_bound == 0:
-            bt_size = column_radius * 2
-            if bt_size >= self.size[0]:
-                bt_size = self.size[0]
-                if object.pos[1] - column_radius > 0:
-                    bt_size = self.size[0] - (object.pos[1] - column_radius)
-            print(self.ui_border_top * bt_size, end="")
-            if column_min_bound <= 0 and column_max_bound >= self.size[0]:
-                print(self.ui_border_top * 2, end="")
-            elif column_min_bound <= 0 or column_max_bound >= self.size[0]:
-                print(self.ui_border_top, end="")
-            print("\r")
+            frame.append(self._border_line(self.ui_border_top, border_size))
         for row in self._matrix[row_min_bound:row_max_bound]:
-            if column_min_bound == 0:
-                print(self.ui_border_left, end="")
-            for y in row[column_min_bound:column_max_bound]:
-                if isinstance(y, BoardItemVoid) and y.model != self.ui_board_void_cell:
-                    y.model = self.ui_board_void_cell
-                print(y, end="")
-            if column_max_bound >= self.size[0]:
-                print(self.ui_border_right, end="")
-            print("\r")
-        if row_max_bound >= self.size[1]:
-            bb_size = column_radius * 2
-            if bb_size >= self.size[0]:
-                bb_size = self.size[0]
-                if object.pos[1] - column_radius > 0:
-                    bb_size = self.size[0] - (object.pos[1] - column_radius)
-            print(self.ui_border_bottom * bb_size, end="")
-            if column_min_bound <= 0 and column_max_bound >= self.size[0]:
-                print(self.ui_border_bottom * 2, end="")
-            elif column_min_bound <= 0 or column_max_bound >= self.size[0]:
-                print(self.ui_border_bottom, end="")
-            print("\r")
+            frame.append(left_border)
+            frame.extend(map(str, row[column_min_bound:column_max_bound]))
+            frame.append(right_border)
+            frame.append("\r\n")
+        if row_max_bound == height:
+            frame.append(self._border_line(self.ui_border_bottom, border_size))
+        # Write the whole frame at once instead of printing cell by cell.
+        sys.stdout.write("".join(frame))
 
     def display(self):
         """Display the entire board.
@@ -362,34 +366,58 @@ class Board:
         BoardItem.model. If you want to override this behavior you have
         to subclass BoardItem.
         """
-        print(
-            "".join(
-                [
-                    self.ui_border_top * len(self._matrix[0]),
-                    self.ui_border_top * 2,
-                    "\r",
-                ]
-            )
-        )
+        if self._void_dirty:
+            self._update_void_cells()
+        border_left = self.ui_border_left
+        border_right = self.ui_border_right + "\r\n"
+        width = len(self._matrix[0]) + 2
+        frame = [self._border_line(self.ui_border_top, width)]
+        for row in self._matrix:
+            frame.append(border_left)
+            frame.extend(map(str, row))
+            frame.append(border_right)
+        frame.append(self._border_line(self.ui_border_bottom, width))
+        # Write the whole frame at once instead of printing cell by cell.
+        sys.stdout.write("".join(frame))
+
+    def _border_line(self, border, size):
+        # Return a line made of size times the border, ready to be displayed. There
+        # is only a couple of different lines per board so they are built once and
+        # reused at each frame.
+        key = (border, size)
+        line = self._border_lines.get(key)
+        if line is None:
+            line = self._border_lines[key] = border * size + "\r\n"
+        return line
+
+    def _update_void_cells(self):
+        # Give the current ui_board_void_cell model to all the void cells that do not
+        # have it. It is only needed after ui_board_void_cell changed or a void cell
+        # with another model was placed, so display() does not do it every frame.
+        void_cell = self.ui_board_void_cell
         for row in self._matrix:
-            print(self.ui_border_left, end="")
             for column in row:
-                if (
-                    isinstance(column, BoardItemVoid)
-                    and column.model != self.ui_board_void_cell
-                ):
-                    column.model = self.ui_board_void_cell
-                print(column, end="")
-            print(self.ui_border_right + "\r")
-        print(
-            "".join(
-                [
-                    self.ui_border_bottom * len(self._matrix[0]),
-                    self.ui_border_bottom * 2,
-                    "\r",
-                ]
-            )
-        )
+                if isinstance(column, BoardItemVoid) and column.model != void_cell:
+                    column.model = void_cell
+        self._void_dirty = False
+
+    def in_bounds(self, row, column):
+        """
+        Return True if the row, column position is within the board's boundaries.
+
+        :param row: The row coordinate.
+        :type row: int
+        :param column: The column coordinate.
+        :type column: int
+        :rtype: bool
+
+        Example::
+
+            if board.in_bounds(row, column):
+                board.clear_cell(row, column)
+        """
+        size = self.size
+        return 0 <= row < size[1] and 0 <= column < size[0]
 
     def item(self, row, column):
         """
@@ -401,7 +429,8 @@ class Board:
         :raise HacOutOfBoardBoundException: if row or column are
             out of bound.
         """
-        if row < self.size[1] and column < self.size[0]:
+        size = self.size
+        if 0 <= row < size[1] and 0 <= column < size[0]:
             return self._matrix[row][column]
         else:
             raise HacOutOfBoardBoundException(
@@ -426,7 +455,8 @@ class Board:
             are both overlappable **and** restorable to save them, but that's
             the extend of it.
         """
-        if row < self.size[1] and column < self.size[0]:
+        size = self.size
+        if 0 <= row < size[1] and 0 <= column < size[0]:
             if isinstance(item, BoardItem):
                 # If we are about to place the item on a overlappable and
                 # restorable we store it to be restored
@@ -437,16 +467,21 @@ class Board:
                     and existing_item.restorable()
                     and existing_item.overlappable()
                 ):
-                    item._overlapping = self._matrix[row][column]
+                    item._overlapping = existing_item
+                if (
+                    isinstance(item, BoardItemVoid)
+                    and item.model != self.ui_board_void_cell
+                ):
+                    self._void_dirty = True
                 # Place the item on the board
                 self._matrix[row][column] = item
                 # Take ownership of the item
                 item.parent = self
                 item.store_position(row, column)
                 if isinstance(item, Movable):
-                    self._movables.add(item)
+                    self._movables[id(item)] = item
                 elif isinstance(item, Immovable):
-                    self._immovables.add(item)
+                    self._immovables[id(item)] = item
             else:
                 raise HacInvalidTypeException(
                     "The item passed in argument is not a subclass of BoardItem"
@@ -504,204 +539,67 @@ class Board:
             # step), direction must be a direction contant from the
             # gamelib.Constants module')
 
-            new_x = None
-            new_y = None
-            if direction == Constants.UP:
-                new_x = item.pos[0] - step
-                new_y = item.pos[1]
-            elif direction == Constants.DOWN:
-                new_x = item.pos[0] + step
-                new_y = item.pos[1]
-            elif direction == Constants.LEFT:
-                new_x = item.pos[0]
-                new_y = item.pos[1] - step
-            elif direction == Constants.RIGHT:
-                new_x = item.pos[0]
-                new_y = item.pos[1] + step
-            elif direction == Constants.DRUP:
-                new_x = item.pos[0] - step
-                new_y = item.pos[1] + step
-            elif direction == Constants.DRDOWN:
-                new_x = item.pos[0] + step
-                new_y = item.pos[1] + step
-            elif direction == Constants.DLUP:
-                new_x = item.pos[0] - step
-                new_y = item.pos[1] - step
-            elif direction == Constants.DLDOWN:
-                new_x = item.pos[0] + step
-                new_y = item.pos[1] - step
-            if (
-                new_x is not None
-                and new_y is not None
-                and new_x >= 0
-                and new_y >= 0
-                and new_x < self.size[1]
-                and new_y < self.size[0]
-                and self._matrix[new_x][new_y].overlappable()
-            ):
+            delta = _DIRECTION_DELTAS.get(direction)
+            if delta is None:
+                # Not a direction we can move to (NO_DIR for example).
+                return
+            row, column = item.pos
+            new_x = row + delta[0] * step
+            new_y = column + delta[1] * step
+            size = self.size
+            if not (0 <= new_x < size[1] and 0 <= new_y < size[0]):
+                return
+            dest = self._matrix[new_x][new_y]
+            # The Actionable permissions that let this item activate an Actionable
+            if isinstance(item, Player):
+                authorized_perms = _PLAYER_PERMS
+            elif isinstance(item, NPC):
+                authorized_perms = _NPC_PERMS
+            else:
+                authorized_perms = frozenset()
+            if dest.overlappable():
                 # If we are here, it means the cell we are going to already
                 # has an overlappable item, so let's save it for
                 # later restoration
                 if (
-                    not isinstance(self._matrix[new_x][new_y], BoardItemVoid)
-                    and isinstance(self._matrix[new_x][new_y], Immovable)
-                    and self._matrix[new_x][new_y].restorable()
+                    not isinstance(dest, BoardItemVoid)
+                    and isinstance(dest, Immovable)
+                    and dest.restorable()
                 ):
                     if item._overlapping is None:
-                        item._overlapping = self._matrix[new_x][new_y]
+                        item._overlapping = dest
                     else:
-                        item._overlapping_buffer = self._matrix[new_x][new_y]
-
-                if isinstance(self._matrix[new_x][new_y], Actionable):
-                    if (
-                        isinstance(item, Player)
-                        and (
-                            (
-                                self._matrix[new_x][new_y].perm
-                                == Constants.PLAYER_AUTHORIZED
-                            )
-                            or (
-                                self._matrix[new_x][new_y].perm
-                                == Constants.ALL_PLAYABLE_AUTHORIZED
-                            )
-                        )
-                    ) or (
-                        isinstance(item, NPC)
-                        and (
-                            (
-                                self._matrix[new_x][new_y].perm
-                                == Constants.NPC_AUTHORIZED
-                            )
-                            or (
-                                self._matrix[new_x][new_y].perm
-                                == Constants.ALL_PLAYABLE_AUTHORIZED
-                            )
-                        )
-                    ):
-                        self._matrix[new_x][new_y].activate()
+                        item._overlapping_buffer = dest
+
+                if isinstance(dest, Actionable):
+                    if dest.perm in authorized_perms:
+                        dest.activate()
                         # Here instead of just placing a BoardItemVoid on
                         # the departure position we first make sure there
                         # is no _overlapping object to restore.
-                        if (
-                            item._overlapping is not None
-                            and isinstance(item._overlapping, Immovable)
-                            and item._overlapping.restorable()
-                            and (
-                                item._overlapping.pos[0] != new_x
-                                or item._overlapping.pos[1] != new_y
-                            )
-                        ):
-                            self.place_item(
-                                item._overlapping,
-                                item._overlapping.pos[0],
-                                item._overlapping.pos[1],
-                            )
-                            if item._overlapping_buffer is not None:
-                                item._overlapping = item._overlapping_buffer
-                                item._overlapping_buffer = None
-                            else:
-                                item._overlapping = None
-                        else:
-                            self.place_item(
-                                BoardItemVoid(model=self.ui_board_void_cell),
-                                item.pos[0],
-                                item.pos[1],
-                            )
+                        if self._restore_overlapped(item, new_x, new_y):
+                            item._overlapping = item._overlapping_buffer
+                            item._overlapping_buffer = None
                         self.place_item(item, new_x, new_y)
                 else:
                     # if there is an overlapped item, restore it.
                     # Else just move
-                    if (
-                        item._overlapping is not None
-                        and isinstance(item._overlapping, Immovable)
-                        and item._overlapping.restorable()
-                        and (
-                            item._overlapping.pos[0] != new_x
-                            or item._overlapping.pos[1] != new_y
-                        )
-                    ):
-                        self.place_item(
-                            item._overlapping,
-                            item._overlapping.pos[0],
-                            item._overlapping.pos[1],
-                        )
-                        if item._overlapping_buffer is not None:
-                            item._overlapping = item._overlapping_buffer
-                            item._overlapping_buffer = None
-                        else:
-                            item._overlapping = None
-                    else:
-                        self.place_item(
-                            BoardItemVoid(model=self.ui_board_void_cell),
-                            item.pos[0],
-                            item.pos[1],
-                        )
+                    if self._restore_overlapped(item, new_x, new_y):
+                        item._overlapping = item._overlapping_buffer
+                        item._overlapping_buffer = None
                     self.place_item(item, new_x, new_y)
-            elif (
-                new_x is not None
-                and new_y is not None
-                and new_x >= 0
-                and new_y >= 0
-                and new_x < self.size[1]
-                and new_y < self.size[0]
-                and self._matrix[new_x][new_y].pickable()
-            ):
+            elif dest.pickable():
                 if isinstance(item, Movable) and item.has_inventory():
-                    item.inventory.add_item(self._matrix[new_x][new_y])
+                    item.inventory.add_item(dest)
                     # Here instead of just placing a BoardItemVoid on the
                     # departure position we first make sure there is no
                     # _overlapping object to restore.
-                    if (
-                        item._overlapping is not None
-                        and isinstance(item._overlapping, Immovable)
-                        and item._overlapping.restorable()
-                        and (
-                            item._overlapping.pos[0] != new_x
-                            or item._overlapping.pos[1] != new_y
-                        )
-                    ):
-                        self.place_item(
-                            item._overlapping,
-                            item._overlapping.pos[0],
-                            item._overlapping.pos[1],
-                        )
+                    if self._restore_overlapped(item, new_x, new_y):
                         item._overlapping = None
-                    else:
-                        self.place_item(
-                            BoardItemVoid(model=self.ui_board_void_cell),
-                            item.pos[0],
-                            item.pos[1],
-                        )
                     self.place_item(item, new_x, new_y)
-            elif (
-                new_x is not None
-                and new_y is not None
-                and new_x >= 0
-                and new_y >= 0
-                and new_x < self.size[1]
-                and new_y < self.size[0]
-                and isinstance(self._matrix[new_x][new_y], Actionable)
-            ):
-                if (
-                    isinstance(item, Player)
-                    and (
-                        (self._matrix[new_x][new_y].perm == Constants.PLAYER_AUTHORIZED)
-                        or (
-                            self._matrix[new_x][new_y].perm
-                            == Constants.ALL_PLAYABLE_AUTHORIZED
-                        )
-                    )
-                ) or (
-                    isinstance(item, NPC)
-                    and (
-                        (self._matrix[new_x][new_y].perm == Constants.NPC_AUTHORIZED)
-                        or (
-                            self._matrix[new_x][new_y].perm
-                            == Constants.ALL_PLAYABLE_AUTHORIZED
-                        )
-                    )
-                ):
-                    self._matrix[new_x][new_y].activate()
+            elif isinstance(dest, Actionable):
+                if dest.perm in authorized_perms:
+                    dest.activate()
         else:
             raise HacObjectIsNotMovableException(
                 (
@@ -711,6 +609,26 @@ class Board:
                 )
             )
 
+    def _restore_overlapped(self, item, new_row, new_column):
+        # Free the cell that item is leaving: put back the item it was overlapping if
+        # it has to be restored there, or a void cell otherwise. Return True if the
+        # overlapped item was restored.
+        # Most of the time the item is not overlapping anything, so that case only
+        # costs one test.
+        overlapped = item._overlapping
+        if (
+            overlapped is not None
+            and isinstance(overlapped, Immovable)
+            and overlapped.restorable()
+        ):
+            row, column = overlapped.pos
+            if row != new_row or column != new_column:
+                self.place_item(overlapped, row, column)
+                return True
+        row, column = item.pos
+        self.place_item(self.generate_void_cell(), row, column)
+        return False
+
     def clear_cell(self, row, column):
         """Clear cell (row, column)
 
@@ -730,10 +648,11 @@ class Board:
             it *will* overwrite the content.
 
         """
-        if self._matrix[row][column] in self._movables:
-            self._movables.discard(self._matrix[row][column])
-        elif self._matrix[row][column] in self._immovables:
-            self._immovables.discard(self._matrix[row][column])
+        item_id = id(self._matrix[row][column])
+        if item_id in self._movables:
+            del self._movables[item_id]
+        elif item_id in self._immovables:
+            del self._immovables[item_id]
         self._matrix[row][column] = None
         # if self._matrix[row][column] in self._movables:
         #     index = self._movables.index(self._matrix[row][column])
@@ -741,9 +660,7 @@ class Board:
         # elif self._matrix[row][column] in self._immovables:
         #     index = self._immovables.index(self._matrix[row][column])
         #     del(self._immovables[index])
-        self.place_item(
-            BoardItemVoid(model=self.ui_board_void_cell, name="void_cell"), row, column
-        )
+        self.place_item(self.generate_void_cell(), row, column)
 
     def get_movables(self, **kwargs):
         """Return a list of all the Movable objects in the Board.
@@ -764,17 +681,9 @@ class Board:
             foes = myboard.get_movables(type="foe")
         """
         if kwargs:
-            retvals = []
-            for item in self._movables:
-                counter = 0
-                for (arg_key, arg_value) in kwargs.items():
-                    if arg_value in getattr(item, arg_key):
-                        counter += 1
-                if counter == len(kwargs):
-                    retvals.append(item)
-            return retvals
+            return _filter_items(self._movables.values(), kwargs)
         else:
-            return list(self._movables)
+            return list(self._movables.values())
 
     def get_immovables(self, **kwargs):
         """Return a list of all the Immovable objects in the Board.
@@ -798,14 +707,6 @@ class Board:
 
         """
         if kwargs:
-            retvals = []
-            for item in self._immovables:
-                counter = 0
-                for (arg_key, arg_value) in kwargs.items():
-                    if arg_value in getattr(item, arg_key):
-                        counter += 1
-                if counter == len(kwargs):
-                    retvals.append(item)
-            return retvals
+            return _filter_items(self._immovables.values(), kwargs)
         else:
-            return list(self._immovables)
+            return list(self._immovables.values())
@@ -3,7 +3,7 @@ from gamelib.HacExceptions import (
     HacInvalidLevelException,
     HacException,
 )
-from gamelib.Board import Board
+from gamelib.Board import Board, _DIRECTION_DELTAS
 from gamelib.BoardItem import BoardItemVoid
 from gamelib.Characters import NPC, Player
 from gamelib.Movable import Projectile
@@ -17,7 +17,10 @@ import gamelib.Structures as Structures
 import gamelib.Constants as Constants
 import gamelib.Utils as Utils
 import random
+import itertools
 import json
+import operator
+import sys
 
 """
 The Game.py module has only one class: Game. It is what could be called the game engine.
@@ -25,6 +28,177 @@ It holds a lot of methods that helps taking care of some complex mechanics behin
 curtain.
 """
 
+# The (row, column) offsets of the cells around an object, indexed by radius. They
+# are computed the first time neighbors() is called with a given radius.
+_NEIGHBOR_OFFSETS = {}
+
+# The item given to Projectile.hit() when a projectile hits nothing. It is never placed
+# on a board, so all projectiles can share it.
+_VOID_HIT = BoardItemVoid()
+
+# The direction constants as they are named in the actuators of saved boards.
+_STRING_TO_CONSTANT = {
+    "UP": Constants.UP,
+    "DOWN": Constants.DOWN,
+    "RIGHT": Constants.RIGHT,
+    "LEFT": Constants.LEFT,
+    "DRUP": Constants.DRUP,
+    "DRDOWN": Constants.DRDOWN,
+    "DLDOWN": Constants.DLDOWN,
+    "DLUP": Constants.DLUP,
+}
+
+# How many random cells add_npc() tries before looking for the empty cells of the board.
+_NPC_PLACEMENT_RETRIES = 20
+
+
+def _wall_ref_fields(obj, ref):
+    ref["size"] = obj.size()
+
+
+def _treasure_ref_fields(obj, ref):
+    ref["value"] = obj.value
+    ref["size"] = obj.size()
+
+
+def _structure_ref_fields(obj, ref):
+    ref["value"] = obj.value
+    ref["size"] = obj.size()
+    ref["overlappable"] = obj.overlappable()
+    ref["pickable"] = obj.pickable()
+    ref["restorable"] = obj.restorable()
+
+
+def _npc_ref_fields(obj, ref):
+    ref["hp"] = obj.hp
+    ref["max_hp"] = obj.max_hp
+    ref["step"] = obj.step
+    ref["remaining_lives"] = obj.remaining_lives
+    ref["attack_power"] = obj.attack_power
+    if obj.actuator is not None:
+        # Subclasses of the actuators are saved as their closest known parent.
+        for cls in type(obj.actuator).__mro__:
+            actuator_ref = _ACTUATOR_REFS.get(cls)
+            if actuator_ref is not None:
+                ref["actuator"] = actuator_ref(obj.actuator)
+                break
+
+
+def _random_actuator_ref(actuator):
+    return {"type": "RandomActuator", "moveset": actuator.moveset}
+
+
+def _patrol_actuator_ref(actuator):
+    return {"type": "PatrolActuator", "path": actuator.path}
+
+
+def _path_actuator_ref(actuator):
+    return {"type": "PathActuator", "path": actuator.path}
+
+
+def _path_finder_ref(actuator):
+    return {
+        "type": "PathFinder",
+        "waypoints": actuator.waypoints,
+        "circle_waypoints": actuator.circle_waypoints,
+    }
+
+
+def _random_actuator_from_ref(ref, npc):
+    return RandomActuator(
+        moveset=[Game._string_to_constant(m) for m in ref.get("moveset", [])]
+    )
+
+
+def _path_actuator_from_ref(ref, npc):
+    return PathActuator(path=[Game._string_to_constant(m) for m in ref.get("path", [])])
+
+
+def _patrol_actuator_from_ref(ref, npc):
+    return PatrolActuator(
+        path=[Game._string_to_constant(m) for m in ref.get("path", [])]
+    )
+
+
+def _path_finder_from_ref(ref, npc):
+    actuator = PathFinder(game=Game(), parent=npc)
+    circle_waypoints = ref.get("circle_waypoints", _MISSING)
+    if circle_waypoints is not _MISSING:
+        actuator.circle_waypoints = circle_waypoints
+    for m in ref.get("waypoints", []):
+        actuator.add_waypoint(m[0], m[1])
+    return actuator
+
+
+# The functions saving the actuators of NPCs (by actuator class) and rebuilding them
+# from saved boards (by the "type" field of the saved actuator).
+_ACTUATOR_REFS = {
+    RandomActuator: _random_actuator_ref,
+    PatrolActuator: _patrol_actuator_ref,
+    PathActuator: _path_actuator_ref,
+    PathFinder: _path_finder_ref,
+}
+_ACTUATORS_FROM_REFS = {
+    "RandomActuator": _random_actuator_from_ref,
+    "PathActuator": _path_actuator_from_ref,
+    "PatrolActuator": _patrol_actuator_from_ref,
+    "PathFinder": _path_finder_from_ref,
+}
+
+
+# The functions adding the class specific fields to the references built by
+# Game._obj2ref(). Subclasses (Door, GenericActionableStructure, etc.) use the entry
+# of their closest parent.
+_REF_FIELDS = {
+    Structures.Wall: _wall_ref_fields,
+    Structures.Treasure: _treasure_ref_fields,
+    Structures.GenericStructure: _structure_ref_fields,
+    NPC: _npc_ref_fields,
+}
+
+
+# The default given to dict.get() to detect the fields missing from a reference. None
+# cannot be used as saved values can be None.
+_MISSING = object()
+
+
+def _attribute_setter(attribute):
+    def set_attribute(obj, value):
+        setattr(obj, attribute, value)
+
+    return set_attribute
+
+
+# The (reference key, setter) pairs Game._ref2obj() restores on the objects it builds.
+_VALUE_FIELDS = (
+    ("value", _attribute_setter("value")),
+    ("size", _attribute_setter("_size")),
+)
+_STRUCTURE_FIELDS = _VALUE_FIELDS + (
+    ("pickable", Structures.GenericStructure.set_pickable),
+    ("overlappable", Structures.GenericStructure.set_overlappable),
+    ("restorable", Structures.GenericStructure.set_restorable),
+)
+_NPC_FIELDS = _VALUE_FIELDS + tuple(
+    (key, _attribute_setter(key))
+    for key in ("hp", "max_hp", "step", "remaining_lives", "attack_power")
+)
+
+# The classes Game._ref2obj() can build, in the order their names are matched
+# against the "object" field of a reference.
+_REF_CLASSES = (
+    ("Wall", Structures.Wall, ()),
+    ("Treasure", Structures.Treasure, _VALUE_FIELDS),
+    ("GenericStructure", Structures.GenericStructure, _STRUCTURE_FIELDS),
+    ("Door", Structures.Door, _STRUCTURE_FIELDS),
+    (
+        "GenericActionableStructure",
+        Structures.GenericActionableStructure,
+        _STRUCTURE_FIELDS,
+    ),
+    ("NPC", NPC, _NPC_FIELDS),
+)
+
 
 class Game:
     """A class that serve as a game engine.
@@ -88,6 +262,24 @@ class Game:
         self.object_library = []
         Utils.init_term_colors()
 
+    @property
+    def partial_display_viewport(self):
+        """The radius (in rows and columns) of the partial display of boards.
+
+        The row and column radii are extracted when it is set, so assign a new list
+        to change the viewport instead of modifying the current one.
+        """
+        return self._partial_display_viewport
+
+    @partial_display_viewport.setter
+    def partial_display_viewport(self, value):
+        self._partial_display_viewport = value
+        # display_board() only uses a list viewport, like it always did.
+        if type(value) is list:
+            self._viewport_radius = (value[0], value[1])
+        else:
+            self._viewport_radius = None
+
     def add_menu_entry(self, category, shortcut, message, data=None):
         """Add a new entry to the menu.
 
@@ -141,7 +333,7 @@ class Game:
             game.update_menu_entry('main_menu','d','Go LEFT',Constants.LEFT)
 
         """
-        if type(category) is str and category in self._menu:
+        if isinstance(category, str) and category in self._menu:
             del self._menu[category]
         else:
             raise HacInvalidTypeException(
@@ -237,16 +429,18 @@ class Game:
                 f"'some shortcut','some message') ? If yes, then you should check "
                 f"for typos.",
             )
+        menu = []
         pagination_counter = 1
         for k in self._menu[category]:
             if k["shortcut"] is None:
-                print(k["message"], end=line_end)
+                menu.append(f"{k['message']}{line_end}")
             else:
-                print(f"{k['shortcut']} - {k['message']}", end=line_end)
+                menu.append(f"{k['shortcut']} - {k['message']}{line_end}")
                 pagination_counter += 1
                 if pagination_counter > paginate:
-                    print("")
+                    menu.append("\n")
                     pagination_counter = 1
+        sys.stdout.write("".join(menu))
 
     def clear_screen(self):
         """
@@ -268,9 +462,13 @@ class Game:
         :type section: str
         :raise FileNotFoundError: If filename is not found on the disk.
         :raise json.decoder.JSONDecodeError: If filename could not be decoded as JSON.
-        :returns: The parsed data.
+        :returns: The parsed data, or None if the section is already loaded.
         :rtype: dict
 
+        .. note:: A section that is already loaded is never overwritten. In that case
+            this method returns None without reading the file, so it does not raise
+            the exceptions above either.
+
         .. warning:: **breaking changes:** before v1.1.0 that method use to load file
             using the configparser module. This have been dumped in favor of json files.
             Since that methods was apparently not used, there is no backward
@@ -289,12 +487,15 @@ class Game:
         if section not in self._configuration_internals:
             self._configuration_internals[section] = {}
 
+        # An already loaded section is never overwritten, so there is no need to read
+        # and parse the file again.
+        if section in self._configuration:
+            return None
         with open(filename) as config_file:
             config_content = json.load(config_file)
-            if section not in self._configuration.keys():
-                self._configuration[section] = config_content
-                self._configuration_internals[section]["loaded_from"] = filename
-                return config_content
+        self._configuration[section] = config_content
+        self._configuration_internals[section]["loaded_from"] = filename
+        return config_content
 
     def config(self, section="main"):
         """Get the content of a previously loaded configuration section.
@@ -386,22 +587,23 @@ class Game:
         :raises HacInvalidTypeException: If either of these parameters are not of the
             correct type.
         """
-        if type(level_number) is int:
-            if isinstance(board, Board):
-                # Add the board to our list
-                self._boards[level_number] = {
-                    "board": board,
-                    "npcs": [],
-                    "projectiles": [],
-                }
-                # Taking ownership
-                board.parent = self
-            else:
-                raise HacInvalidTypeException(
-                    "The board paramater must be a gamelib.Board.Board() object."
-                )
-        else:
+        try:
+            level_number = operator.index(level_number)
+        except TypeError:
             raise HacInvalidTypeException("The level number must be an int.")
+        if isinstance(board, Board):
+            # Add the board to our list
+            self._boards[level_number] = {
+                "board": board,
+                "npcs": [],
+                "projectiles": [],
+            }
+            # Taking ownership
+            board.parent = self
+        else:
+            raise HacInvalidTypeException(
+                "The board paramater must be a gamelib.Board.Board() object."
+            )
 
     def get_board(self, level_number):
         """
@@ -415,10 +617,28 @@ class Game:
 
             level1_board = mygame.get_board(1)
         """
-        if type(level_number) is int:
-            return self._boards[level_number]["board"]
-        else:
+        try:
+            level_number = operator.index(level_number)
+        except TypeError:
             raise HacInvalidTypeException("The level number must be an int.")
+        return self._boards[level_number]["board"]
+
+    def _resolve_level(self, level_number):
+        """Return the dictionary holding the board, NPCs and projectiles of a level.
+
+        :raises HacInvalidTypeException: if the level_number is not an int.
+        :raises HacInvalidLevelException: if no board is associated with the level.
+        """
+        try:
+            level_number = operator.index(level_number)
+        except TypeError:
+            raise HacInvalidTypeException("The level number must be an int.")
+        try:
+            return self._boards[level_number]
+        except KeyError:
+            raise HacInvalidLevelException(
+                f"The level number {level_number} is not associated with any board."
+            )
 
     def current_board(self):
         """
@@ -431,9 +651,11 @@ class Game:
         If current_level is set to a value with no corresponding board a HacException
         exception is raised with an invalid_level error.
         """
-        if self.current_level in self._boards.keys():
+        # current_level is a public attribute that games can set directly, so the
+        # board cannot be cached. A single lookup is enough though.
+        try:
             return self._boards[self.current_level]["board"]
-        else:
+        except KeyError:
             raise HacInvalidLevelException(
                 "The current level does not correspond to any board."
             )
@@ -452,38 +674,39 @@ class Game:
 
         :raises HacInvalidTypeException: If parameter is not an int.
         """
-        if type(level_number) is int:
-            if self.player is None:
-                raise HacException(
-                    "undefined_player",
-                    "Game.player is undefined. We cannot change level without a player."
-                    " Please set player in your Game object: mygame.player = Player()",
-                )
-            # If it's not already the case, taking ownership of player
-            if self.player.parent != self:
-                self.player.parent = self
-            if level_number in self._boards.keys():
-                if self.player.pos[0] is not None or self.player.pos[1] is not None:
-                    self._boards[self.current_level]["board"].clear_cell(
-                        self.player.pos[0], self.player.pos[1]
-                    )
-                self.current_level = level_number
-                b = self._boards[self.current_level]["board"]
-                b.place_item(
-                    self.player,
-                    b.player_starting_position[0],
-                    b.player_starting_position[1],
-                )
-            else:
-                raise HacInvalidLevelException(
-                    f"Impossible to change level to an unassociated level (level number"
-                    f" {level_number} is not associated with any board).\nHave you "
-                    f"called:\ngame.add_board({level_number},Board()) ?"
-                )
-        else:
+        try:
+            level_number = operator.index(level_number)
+        except TypeError:
             raise HacInvalidTypeException(
                 "level_number needs to be an int in change_level(level_number)."
             )
+        if self.player is None:
+            raise HacException(
+                "undefined_player",
+                "Game.player is undefined. We cannot change level without a player."
+                " Please set player in your Game object: mygame.player = Player()",
+            )
+        # If it's not already the case, taking ownership of player
+        if self.player.parent != self:
+            self.player.parent = self
+        if level_number in self._boards:
+            if self.player.pos[0] is not None or self.player.pos[1] is not None:
+                self._boards[self.current_level]["board"].clear_cell(
+                    self.player.pos[0], self.player.pos[1]
+                )
+            self.current_level = level_number
+            b = self._boards[self.current_level]["board"]
+            b.place_item(
+                self.player,
+                b.player_starting_position[0],
+                b.player_starting_position[1],
+            )
+        else:
+            raise HacInvalidLevelException(
+                f"Impossible to change level to an unassociated level (level number"
+                f" {level_number} is not associated with any board).\nHave you "
+                f"called:\ngame.add_board({level_number},Board()) ?"
+            )
 
     def add_npc(self, level_number, npc, row=None, column=None):
         """
@@ -505,59 +728,69 @@ class Game:
         :type column: int
 
         If either of these parameters are not of the correct type, a
-        HacInvalidTypeException exception is raised.
+        HacInvalidTypeException exception is raised. If the NPC has to be placed
+        randomly and there is no empty cell left on the board, a HacException
+        exception is raised.
 
         .. Important:: If the NPC does not have an actuator, this method is going to
             affect a gamelib.Actuators.SimpleActuators.RandomActuator() to
             npc.actuator. And if npc.step == None, this method sets it to 1
         """
-        if type(level_number) is int:
-            if isinstance(npc, NPC):
-                if row is None or column is None:
-                    retry = 0
-                    while True:
-                        if row is None:
-                            row = random.randint(
-                                0, self._boards[level_number]["board"].size[1] - 1
-                            )
-                        if column is None:
-                            column = random.randint(
-                                0, self._boards[level_number]["board"].size[0] - 1
-                            )
-                        if isinstance(
-                            self._boards[level_number]["board"].item(row, column),
-                            BoardItemVoid,
-                        ):
-                            break
-                        else:
-                            row = None
-                            column = None
-                            retry += 1
-                if type(row) is int:
-                    if type(column) is int:
-                        if npc.actuator is None:
-                            npc.actuator = RandomActuator(
-                                moveset=[
-                                    Constants.UP,
-                                    Constants.DOWN,
-                                    Constants.LEFT,
-                                    Constants.RIGHT,
-                                ]
-                            )
-                        if npc.step is None:
-                            npc.step = 1
-                        self._boards[level_number]["board"].place_item(npc, row, column)
-                        self._boards[level_number]["npcs"].append(npc)
-                    else:
-                        raise HacInvalidTypeException("column must be an int.")
+        level = self._resolve_level(level_number)
+        if isinstance(npc, NPC):
+            board = level["board"]
+            if row is None or column is None:
+                # Random cells are the fastest way to find an empty cell on a
+                # mostly empty board, but they can take forever on a crowded one.
+                height = board.size[1]
+                width = board.size[0]
+                for retry in range(_NPC_PLACEMENT_RETRIES):
+                    if row is None:
+                        row = random.randrange(height)
+                    if column is None:
+                        column = random.randrange(width)
+                    if isinstance(board.item(row, column), BoardItemVoid):
+                        break
+                    row = None
+                    column = None
                 else:
-                    raise HacInvalidTypeException("row must be an int.")
+                    # Pick among the remaining empty cells instead.
+                    void_cells = [
+                        (r, c)
+                        for r, board_row in enumerate(board._matrix)
+                        for c, item in enumerate(board_row)
+                        if isinstance(item, BoardItemVoid)
+                    ]
+                    if not void_cells:
+                        raise HacException(
+                            "no_void_cell",
+                            "Cannot place the NPC randomly: there is no empty cell "
+                            f"left on the board of level {level_number}.",
+                        )
+                    row, column = random.choice(void_cells)
+            if type(row) is int:
+                if type(column) is int:
+                    if npc.actuator is None:
+                        npc.actuator = RandomActuator(
+                            moveset=[
+                                Constants.UP,
+                                Constants.DOWN,
+                                Constants.LEFT,
+                                Constants.RIGHT,
+                            ]
+                        )
+                    if npc.step is None:
+                        npc.step = 1
+                    board.place_item(npc, row, column)
+                    level["npcs"].append(npc)
+                else:
+                    raise HacInvalidTypeException("column must be an int.")
             else:
-                raise HacInvalidTypeException(
-                    "The npc paramater must be a gamelib.Characters.NPC() object."
-                )
+                raise HacInvalidTypeException("row must be an int.")
         else:
-            raise HacInvalidTypeException("The level number must be an int.")
+            raise HacInvalidTypeException(
+                "The npc paramater must be a gamelib.Characters.NPC() object."
+            )
 
     def actuate_npcs(self, level_number):
         """Actuate all NPCs on a given level
@@ -577,22 +810,12 @@ class Game:
             is PAUSED or STOPPED, theNPC is not moved.
         """
         if self.state == Constants.RUNNING:
-            if type(level_number) is int:
-                if level_number in self._boards.keys():
-                    for npc in self._boards[level_number]["npcs"]:
-                        if npc.actuator.state == Constants.RUNNING:
-                            self._boards[level_number]["board"].move(
-                                npc, npc.actuator.next_move(), npc.step
-                            )
-                else:
-                    raise HacInvalidLevelException(
-                        f"Impossible to actuate NPCs for this level (level number "
-                        f"{level_number} is not associated with any board)."
-                    )
-            else:
-                raise HacInvalidTypeException(
-                    "In actuate_npcs(level_number) the level_number must be an int."
-                )
+            level = self._resolve_level(level_number)
+            board = level["board"]
+            running = Constants.RUNNING
+            for npc in level["npcs"]:
+                if npc.actuator.state == running:
+                    board.move(npc, npc.actuator.next_move(), npc.step)
 
     def add_projectile(self, level_number, projectile, row=None, column=None):
         """
@@ -620,59 +843,47 @@ class Game:
             to projectile.actuator. And if projectile.step == None, this method sets it
             to 1.
         """
-        if type(level_number) is int:
-            if isinstance(projectile, Projectile):
-                if row is None or column is None:
-                    raise HacInvalidTypeException(
-                        "In Game.add_projectile neither row nor column can be None."
-                    )
-                if type(row) is int:
-                    if type(column) is int:
-                        # If we're trying to send a projectile out of the board's bounds
-                        # We do nothing and return.
-                        if (
-                            row >= self._boards[level_number]["board"].size[1]
-                            or column >= self._boards[level_number]["board"].size[0]
-                            or row < 0
-                            or column < 0
-                        ):
-                            return
-                        # If there is something were we should put the projectile,
-                        # then we consider it an immediate hit.
-                        check_object = self._boards[level_number]["board"].item(
-                            row, column
-                        )
-                        if not isinstance(check_object, BoardItemVoid):
-                            if projectile.is_aoe:
-                                # AoE is easy, just return everything in range
-                                projectile.hit(
-                                    self.neighbors(projectile.aoe_radius, check_object)
-                                )
-                                return
-                            else:
-                                projectile.hit([check_object])
-                                return
-                        if projectile.actuator is None:
-                            projectile.actuator = RandomActuator(
-                                moveset=[Constants.RIGHT]
+        level = self._resolve_level(level_number)
+        if isinstance(projectile, Projectile):
+            if row is None or column is None:
+                raise HacInvalidTypeException(
+                    "In Game.add_projectile neither row nor column can be None."
+                )
+            if type(row) is int:
+                if type(column) is int:
+                    # If we're trying to send a projectile out of the board's bounds
+                    # We do nothing and return.
+                    board = level["board"]
+                    if not board.in_bounds(row, column):
+                        return
+                    # If there is something were we should put the projectile,
+                    # then we consider it an immediate hit.
+                    check_object = board._matrix[row][column]
+                    if not isinstance(check_object, BoardItemVoid):
+                        if projectile.is_aoe:
+                            # AoE is easy, just return everything in range
+                            projectile.hit(
+                                self.neighbors(projectile.aoe_radius, check_object)
                             )
-                        if projectile.step is None:
-                            projectile.step = 1
-                        self._boards[level_number]["board"].place_item(
-                            projectile, row, column
-                        )
-                        self._boards[level_number]["projectiles"].append(projectile)
-                    else:
-                        raise HacInvalidTypeException("column must be an int.")
+                            return
+                        else:
+                            projectile.hit([check_object])
+                            return
+                    if projectile.actuator is None:
+                        projectile.actuator = RandomActuator(moveset=[Constants.RIGHT])
+                    if projectile.step is None:
+                        projectile.step = 1
+                    board.place_item(projectile, row, column)
+                    level["projectiles"].append(projectile)
                 else:
-                    raise HacInvalidTypeException("row must be an int.")
+                    raise HacInvalidTypeException("column must be an int.")
             else:
-                raise HacInvalidTypeException(
-                    "The projectile paramater must be a "
-                    "gamelib.Characters.Projectile() object."
-                )
+                raise HacInvalidTypeException("row must be an int.")
         else:
-            raise HacInvalidTypeException("The level number must be an int.")
+            raise HacInvalidTypeException(
+                "The projectile paramater must be a "
+                "gamelib.Characters.Projectile() object."
+            )
 
     def remove_npc(self, level_number, npc):
         """This methods remove the NPC from the level in parameter.
@@ -686,8 +897,10 @@ class Game:
 
             mygame.remove_npc(1, dead_npc)
         """
-        self._boards[level_number]["npcs"].remove(npc)
-        self.current_board().clear_cell(npc.pos[0], npc.pos[1])
+        level = self._resolve_level(level_number)
+        level["npcs"].remove(npc)
+        row, column = npc.pos
+        level["board"].clear_cell(row, column)
 
     def actuate_projectiles(self, level_number):
         """Actuate all Projectiles on a given level
@@ -712,82 +925,58 @@ class Game:
             RUNNING. If it is PAUSED or STOPPED, the Projectile is not moved.
         """
         if self.state == Constants.RUNNING:
-            if type(level_number) is int:
-                if level_number in self._boards.keys():
-                    board = self._boards[level_number]["board"]
-                    for proj in self._boards[level_number]["projectiles"]:
-                        if proj.actuator.state == Constants.RUNNING:
-                            if proj.range > 0:
-                                init_position = proj.pos
-                                direction = proj.actuator.next_move()
-                                board.move(proj, direction, proj.step)
-                                proj.range -= proj.step
-                                # If range was positive and position did not change
-                                # it means something is blocking the projectile path
-                                # in other words: we detected a collision.
-                                if proj.pos == init_position:
-                                    if proj.is_aoe:
-                                        # AoE is easy, just return everything in range
-                                        proj.hit(self.neighbors(proj.aoe_radius, proj))
-                                    else:
-                                        # directional hit requires us to get the item
-                                        # that blocked our path
-                                        proj.hit([BoardItemVoid()])
-                                        new_x = None
-                                        new_y = None
-                                        if direction == Constants.UP:
-                                            new_x = proj.pos[0] - proj.step
-                                            new_y = proj.pos[1]
-                                        elif direction == Constants.DOWN:
-                                            new_x = proj.pos[0] + proj.step
-                                            new_y = proj.pos[1]
-                                        elif direction == Constants.LEFT:
-                                            new_x = proj.pos[0]
-                                            new_y = proj.pos[1] - proj.step
-                                        elif direction == Constants.RIGHT:
-                                            new_x = proj.pos[0]
-                                            new_y = proj.pos[1] + proj.step
-                                        elif direction == Constants.DRUP:
-                                            new_x = proj.pos[0] - proj.step
-                                            new_y = proj.pos[1] + proj.step
-                                        elif direction == Constants.DRDOWN:
-                                            new_x = proj.pos[0] + proj.step
-                                            new_y = proj.pos[1] + proj.step
-                                        elif direction == Constants.DLUP:
-                                            new_x = proj.pos[0] - proj.step
-                                            new_y = proj.pos[1] - proj.step
-                                        elif direction == Constants.DLDOWN:
-                                            new_x = proj.pos[0] + proj.step
-                                            new_y = proj.pos[1] - proj.step
-                                        if (
-                                            new_x is not None
-                                            and new_y is not None
-                                            and new_x >= 0
-                                            and new_y >= 0
-                                            and new_x < board.size[1]
-                                            and new_y < board.size[0]
-                                        ):
-                                            proj.hit([board.item(new_x, new_y)])
-                            elif proj.range == 0:
-                                if proj.is_aoe:
-                                    proj.hit(self.neighbors(proj.aoe_radius, proj))
-                                else:
-                                    proj.hit([BoardItemVoid()])
+            level = self._resolve_level(level_number)
+            board = level["board"]
+            projectiles = level["projectiles"]
+            # Projectiles are removed after the loop: removing them from the
+            # list we are iterating would skip the next one.
+            expired = set()
+            running = Constants.RUNNING
+            stopped = Constants.STOPPED
+            for proj in projectiles:
+                state = proj.actuator.state
+                if state == running:
+                    if proj.range > 0:
+                        init_position = proj.pos
+                        direction = proj.actuator.next_move()
+                        board.move(proj, direction, proj.step)
+                        proj.range -= proj.step
+                        # If range was positive and position did not change
+                        # it means something is blocking the projectile path
+                        # in other words: we detected a collision.
+                        if proj.pos == init_position:
+                            if proj.is_aoe:
+                                # AoE is easy, just return everything in range
+                                proj.hit(self.neighbors(proj.aoe_radius, proj))
                             else:
-                                self._boards[level_number]["projectiles"].remove(proj)
-                                board.clear_cell(proj.pos[0], proj.pos[1])
-                        elif proj.actuator.state == Constants.STOPPED:
-                            self._boards[level_number]["projectiles"].remove(proj)
-                            board.clear_cell(proj.pos[0], proj.pos[1])
-                else:
-                    raise HacInvalidLevelException(
-                        f"Impossible to actuate NPCs for this level (level number "
-                        f"{level_number} is not associated with any board)."
-                    )
-            else:
-                raise HacInvalidTypeException(
-                    "In actuate_npcs(level_number) the level_number must be an int."
-                )
+                                # directional hit requires us to get the item
+                                # that blocked our path. If there is none (the
+                                # projectile hit the edge of the board) it hits
+                                # the void.
+                                blocker = _VOID_HIT
+                                delta = _DIRECTION_DELTAS.get(direction)
+                                if delta is not None:
+                                    row, column = proj.pos
+                                    new_x = row + delta[0] * proj.step
+                                    new_y = column + delta[1] * proj.step
+                                    if board.in_bounds(new_x, new_y):
+                                        blocker = board._matrix[new_x][new_y]
+                                proj.hit([blocker])
+                    elif proj.range == 0:
+                        if proj.is_aoe:
+                            proj.hit(self.neighbors(proj.aoe_radius, proj))
+                        else:
+                            proj.hit([_VOID_HIT])
+                    else:
+                        expired.add(proj)
+                        row, column = proj.pos
+                        board.clear_cell(row, column)
+                elif state == stopped:
+                    expired.add(proj)
+                    row, column = proj.pos
+                    board.clear_cell(row, column)
+            if expired:
+                projectiles[:] = [p for p in projectiles if p not in expired]
 
     def animate_items(self, level_number):
         """That method goes through all the BoardItems of a given map and call
@@ -803,23 +992,11 @@ class Game:
             mygame.animate_items(1)
         """
         if self.state == Constants.RUNNING:
-            if type(level_number) is int:
-                if level_number in self._boards.keys():
-                    for item in self._boards[level_number]["board"].get_immovables():
-                        if item.animation is not None:
-                            item.animation.next_frame()
-                    for item in self._boards[level_number]["board"].get_movables():
-                        if item.animation is not None:
-                            item.animation.next_frame()
-                else:
-                    raise HacInvalidLevelException(
-                        "Impossible to animate items for this level (level number "
-                        f"{level_number} is not associated with any board)."
-                    )
-            else:
-                raise HacInvalidTypeException(
-                    "In animate_items(level_number) the level_number must be an int."
-                )
+            board = self._resolve_level(level_number)["board"]
+            for item in itertools.chain(board.get_immovables(), board.get_movables()):
+                animation = item.animation
+                if animation is not None:
+                    animation.next_frame()
 
     def display_player_stats(
         self, life_model=Utils.RED_RECT, void_model=Utils.BLACK_RECT
@@ -883,16 +1060,10 @@ class Game:
             # This will call Game.current_board().display()
             mygame.display()
         """
-        if (
-            self.enable_partial_display
-            and self.partial_display_viewport is not None
-            and type(self.partial_display_viewport) is list
-        ):
+        if self.enable_partial_display and self._viewport_radius is not None:
             # display_around(self, object, p_row, p_col)
             self.current_board().display_around(
-                self.player,
-                self.partial_display_viewport[0],
-                self.partial_display_viewport[1],
+                self.player, self._viewport_radius[0], self._viewport_radius[1]
             )
         else:
             self.current_board().display()
@@ -923,20 +1094,27 @@ class Game:
             )
         if object is None:
             object = self.player
+        offsets = _NEIGHBOR_OFFSETS.get(radius)
+        if offsets is None:
+            offsets = _NEIGHBOR_OFFSETS[radius] = tuple(
+                (x, y)
+                for x in range(-radius, radius + 1, 1)
+                for y in range(-radius, radius + 1, 1)
+                if x != 0 or y != 0
+            )
+        board = self.current_board()
+        matrix = board._matrix
+        height = board.size[1]
+        width = board.size[0]
+        row, column = object.pos
         return_array = []
-        for x in range(-radius, radius + 1, 1):
-            for y in range(-radius, radius + 1, 1):
-                if x == 0 and y == 0:
-                    continue
-                true_x = object.pos[0] + x
-                true_y = object.pos[1] + y
-                if (
-                    true_x < self.current_board().size[1]
-                    and true_y < self.current_board().size[0]
-                ) and not isinstance(
-                    self.current_board().item(true_x, true_y), BoardItemVoid
-                ):
-                    return_array.append(self.current_board().item(true_x, true_y))
+        for x, y in offsets:
+            true_x = row + x
+            true_y = column + y
+            if 0 <= true_x < height and 0 <= true_y < width:
+                item = matrix[true_x][true_y]
+                if not isinstance(item, BoardItemVoid):
+                    return_array.append(item)
         return return_array
 
     def load_board(self, filename, lvl_number=0):
@@ -964,25 +1142,24 @@ class Game:
             mynewboard = game.load_board( 'awesome_level.json', 1 )
             game.change_level( 1 )
         """
-        with open(filename, "r") as f:
+        with open(filename, "r", encoding="utf-8") as f:
             data = json.load(f)
         local_board = Board()
-        data_keys = data.keys()
-        if "name" in data_keys:
+        if "name" in data:
             local_board.name = data["name"]
-        if "size" in data_keys:
+        if "size" in data:
             local_board.size = data["size"]
-        if "player_starting_position" in data_keys:
+        if "player_starting_position" in data:
             local_board.player_starting_position = data["player_starting_position"]
-        if "ui_border_top" in data_keys:
+        if "ui_border_top" in data:
             local_board.ui_border_top = data["ui_border_top"]
-        if "ui_border_bottom" in data_keys:
+        if "ui_border_bottom" in data:
             local_board.ui_border_bottom = data["ui_border_bottom"]
-        if "ui_border_left" in data_keys:
+        if "ui_border_left" in data:
             local_board.ui_border_left = data["ui_border_left"]
-        if "ui_border_right" in data_keys:
+        if "ui_border_right" in data:
             local_board.ui_border_right = data["ui_border_right"]
-        if "ui_board_void_cell" in data_keys:
+        if "ui_board_void_cell" in data:
             local_board.ui_board_void_cell = data["ui_board_void_cell"]
         # Now we need to recheck for board sanity
         local_board.check_sanity()
@@ -993,19 +1170,17 @@ class Game:
         self.add_board(lvl_number, local_board)
 
         # Now load the library if any
-        if "library" in data_keys:
+        if "library" in data:
             self.object_library = []
             for e in data["library"]:
                 self.object_library.append(Game._ref2obj(e))
         # Now let's place the good stuff on the board
-        if "map_data" in data_keys:
-            for pos_x in data["map_data"].keys():
+        if "map_data" in data:
+            for pos_x, map_row in data["map_data"].items():
                 x = int(pos_x)
-                for pos_y in data["map_data"][pos_x].keys():
+                for pos_y, ref in map_row.items():
                     y = int(pos_y)
-                    ref = data["map_data"][pos_x][pos_y]
-                    obj_keys = ref.keys()
-                    if "object" in obj_keys:
+                    if "object" in ref:
                         o = Game._ref2obj(ref)
                         if not isinstance(o, NPC) and not isinstance(o, BoardItemVoid):
                             local_board.place_item(o, x, y)
@@ -1045,21 +1220,12 @@ class Game:
 
         If Game.object_library is not an empty array, it will be saved also.
         """
-        if type(lvl_number) is not int:
-            raise HacInvalidTypeException(
-                "lvl_number must be an int in Game.save_board()"
-            )
         if type(filename) is not str:
             raise HacInvalidTypeException("filename must be a str in Game.save_board()")
-        if lvl_number not in self._boards:
-            raise HacInvalidLevelException(
-                f"lvl_number {lvl_number}"
-                " does not correspond to any level associated with a board in "
-                "Game.save_board()"
-            )
+        level = self._resolve_level(lvl_number)
 
         data = {}
-        local_board = self._boards[lvl_number]["board"]
+        local_board = level["board"]
         data["name"] = local_board.name
         data["player_starting_position"] = local_board.player_starting_position
         data["ui_border_left"] = local_board.ui_border_left
@@ -1075,18 +1241,16 @@ class Game:
             for o in self.object_library:
                 data["library"].append(Game._obj2ref(o))
 
-        # Now we need to run through all the cells to store
-        # anything that is not a BoardItemVoid
-        for x in self.current_board()._matrix:
+        # Now we need to run through all the cells of the board to store
+        # anything that is not a BoardItemVoid (or the player)
+        map_data = data["map_data"]
+        obj2ref = Game._obj2ref
+        for x in local_board._matrix:
             for y in x:
-                if not isinstance(y, BoardItemVoid) and not isinstance(y, Player):
-                    # print(f"Item: name={y.name} pos={y.pos} type={y.type}")
-                    if str(y.pos[0]) not in data["map_data"].keys():
-                        data["map_data"][str(y.pos[0])] = {}
-
-                    data["map_data"][str(y.pos[0])][str(y.pos[1])] = Game._obj2ref(y)
-        with open(filename, "w") as f:
-            json.dump(data, f)
+                if not isinstance(y, (BoardItemVoid, Player)):
+                    map_data.setdefault(str(y.pos[0]), {})[str(y.pos[1])] = obj2ref(y)
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
 
     def start(self):
         """Set the game engine state to RUNNING.
@@ -1130,173 +1294,40 @@ class Game:
             "type": obj.type,
         }
 
-        if isinstance(obj, Structures.Wall):
-            ref["size"] = obj.size()
-        elif isinstance(obj, Structures.Treasure):
-            ref["value"] = obj.value
-            ref["size"] = obj.size()
-        elif isinstance(obj, Structures.GenericActionableStructure) or isinstance(
-            obj, Structures.GenericStructure
-        ):
-            ref["value"] = obj.value
-            ref["size"] = obj.size()
-            ref["overlappable"] = obj.overlappable()
-            ref["pickable"] = obj.pickable()
-            ref["restorable"] = obj.restorable()
-        elif isinstance(obj, Structures.Door):
-            ref["value"] = obj.value
-            ref["size"] = obj.size()
-            ref["overlappable"] = obj.overlappable()
-            ref["pickable"] = obj.pickable()
-            ref["restorable"] = obj.restorable()
-        elif isinstance(obj, NPC):
-            ref["hp"] = obj.hp
-            ref["max_hp"] = obj.max_hp
-            ref["step"] = obj.step
-            ref["remaining_lives"] = obj.remaining_lives
-            ref["attack_power"] = obj.attack_power
-            if obj.actuator is not None:
-                if isinstance(obj.actuator, RandomActuator):
-                    ref["actuator"] = {
-                        "type": "RandomActuator",
-                        "moveset": obj.actuator.moveset,
-                    }
-                elif isinstance(obj.actuator, PatrolActuator):
-                    ref["actuator"] = {
-                        "type": "PatrolActuator",
-                        "path": obj.actuator.path,
-                    }
-                elif isinstance(obj.actuator, PathActuator):
-                    ref["actuator"] = {
-                        "type": "PathActuator",
-                        "path": obj.actuator.path,
-                    }
-                elif isinstance(obj.actuator, PathFinder):
-                    ref["actuator"] = {
-                        "type": "PathFinder",
-                        "waypoints": obj.actuator.waypoints,
-                        "circle_waypoints": obj.actuator.circle_waypoints,
-                    }
+        # Add the fields specific to the closest class that has some.
+        for cls in type(obj).__mro__:
+            add_fields = _REF_FIELDS.get(cls)
+            if add_fields is not None:
+                add_fields(obj, ref)
+                break
         return ref
 
     @staticmethod
     def _string_to_constant(s):
         if type(s) is int:
             return s
-        elif s == "UP":
-            return Constants.UP
-        elif s == "DOWN":
-            return Constants.DOWN
-        elif s == "RIGHT":
-            return Constants.RIGHT
-        elif s == "LEFT":
-            return Constants.LEFT
-        elif s == "DRUP":
-            return Constants.DRUP
-        elif s == "DRDOWN":
-            return Constants.DRDOWN
-        elif s == "DLDOWN":
-            return Constants.DLDOWN
-        elif s == "DLUP":
-            return Constants.DLUP
+        return _STRING_TO_CONSTANT.get(s)
 
     @staticmethod
     def _ref2obj(ref):
-        obj_keys = ref.keys()
-        local_object = BoardItemVoid()
-        if "Wall" in ref["object"]:
-            local_object = Structures.Wall()
-        elif "Treasure" in ref["object"]:
-            local_object = Structures.Treasure()
-            if "value" in obj_keys:
-                local_object.value = ref["value"]
-            if "size" in obj_keys:
-                local_object._size = ref["size"]
-        elif "GenericStructure" in ref["object"]:
-            local_object = Structures.GenericStructure()
-            if "value" in obj_keys:
-                local_object.value = ref["value"]
-            if "size" in obj_keys:
-                local_object._size = ref["size"]
-            if "pickable" in obj_keys:
-                local_object.set_pickable(ref["pickable"])
-            if "overlappable" in obj_keys:
-                local_object.set_overlappable(ref["overlappable"])
-        elif "Door" in ref["object"]:
-            local_object = Structures.Door()
-            if "value" in obj_keys:
-                local_object.value = ref["value"]
-            if "size" in obj_keys:
-                local_object._size = ref["size"]
-            if "pickable" in obj_keys:
-                local_object.set_pickable(ref["pickable"])
-            if "overlappable" in obj_keys:
-                local_object.set_overlappable(ref["overlappable"])
-            if "restorable" in obj_keys:
-                local_object.set_restorable(ref["restorable"])
-        elif "GenericActionableStructure" in ref["object"]:
-            local_object = Structures.GenericActionableStructure()
-            if "value" in obj_keys:
-                local_object.value = ref["value"]
-            if "size" in obj_keys:
-                local_object._size = ref["size"]
-            if "pickable" in obj_keys:
-                local_object.set_pickable(ref["pickable"])
-            if "overlappable" in obj_keys:
-                local_object.set_overlappable(ref["overlappable"])
-        elif "NPC" in ref["object"]:
-            local_object = NPC()
-            if "value" in obj_keys:
-                local_object.value = ref["value"]
-            if "size" in obj_keys:
-                local_object._size = ref["size"]
-            if "hp" in obj_keys:
-                local_object.hp = ref["hp"]
-            if "max_hp" in obj_keys:
-                local_object.max_hp = ref["max_hp"]
-            if "step" in obj_keys:
-                local_object.step = ref["step"]
-            if "remaining_lives" in obj_keys:
-                local_object.remaining_lives = ref["remaining_lives"]
-            if "attack_power" in obj_keys:
-                local_object.attack_power = ref["attack_power"]
-            if "actuator" in obj_keys:
-                if "RandomActuator" in ref["actuator"]["type"]:
-                    local_object.actuator = RandomActuator(moveset=[])
-                    if "moveset" in ref["actuator"].keys():
-                        for m in ref["actuator"]["moveset"]:
-                            local_object.actuator.moveset.append(
-                                Game._string_to_constant(m)
-                            )
-                elif "PathActuator" in ref["actuator"]["type"]:
-                    local_object.actuator = PathActuator(path=[])
-                    if "path" in ref["actuator"].keys():
-                        for m in ref["actuator"]["path"]:
-                            local_object.actuator.path.append(
-                                Game._string_to_constant(m)
-                            )
-                elif "PatrolActuator" in ref["actuator"]["type"]:
-                    local_object.actuator = PatrolActuator(path=[])
-                    if "path" in ref["actuator"].keys():
-                        for m in ref["actuator"]["path"]:
-                            local_object.actuator.path.append(
-                                Game._string_to_constant(m)
-                            )
-                elif "PathFinder" in ref["actuator"]["type"]:
-                    local_object.actuator = PathFinder(game=Game(), parent=local_object)
-                    if "circle_waypoints" in ref["actuator"].keys():
-                        local_object.actuator.circle_waypoints = ref["actuator"][
-                            "circle_waypoints"
-                        ]
-                    if "waypoints" in ref["actuator"].keys():
-                        for m in ref["actuator"]["waypoints"]:
-                            local_object.actuator.add_waypoint(m[0], m[1])
+        # Find the class to build from its name in the reference.
+        for class_name, cls, fields in _REF_CLASSES:
+            if class_name in ref["object"]:
+                break
+        else:
+            return BoardItemVoid()
+        local_object = cls()
+        for key, set_field in fields:
+            value = ref.get(key, _MISSING)
+            if value is not _MISSING:
+                set_field(local_object, value)
+        if isinstance(local_object, NPC) and "actuator" in ref:
+            actuator_from_ref = _ACTUATORS_FROM_REFS.get(ref["actuator"]["type"])
+            if actuator_from_ref is not None:
+                local_object.actuator = actuator_from_ref(ref["actuator"], local_object)
         # Now what remains is what is common to all BoardItem
-        if not isinstance(local_object, BoardItemVoid):
-            if "name" in obj_keys:
-                local_object.name = ref["name"]
-            if "model" in obj_keys:
-                local_object.model = ref["model"]
-            if "type" in obj_keys:
-                local_object.type = ref["type"]
+        for key in ("name", "model", "type"):
+            value = ref.get(key, _MISSING)
+            if value is not _MISSING:
+                setattr(local_object, key, value)
         return local_object
@@ -2,7 +2,6 @@
 """
 from gamelib.BoardItem import BoardItem
 from gamelib.HacExceptions import HacInvalidTypeException, HacInventoryException
-import uuid
 
 
 class Inventory:
@@ -31,6 +30,10 @@ class Inventory:
     def __init__(self, max_size=10, parent=None):
         self.max_size = max_size
         self.__items = {}
+        # The cumulated size of the items, updated when items are added or removed.
+        self._size = 0
+        # The suffix added to the next item whose name is empty or already used.
+        self._name_counter = 1
         self.parent = parent
 
     def __str__(self):
@@ -38,16 +41,13 @@ class Inventory:
         s += "= inventory =\n"
         s += "============="
         types = {}
-        for k in self.__items.keys():
-            if self.__items[k].type in types.keys():
-                types[self.__items[k].type]["size"] += self.__items[k].size()
+        for item in self.__items.values():
+            if item.type in types:
+                types[item.type]["size"] += item.size()
             else:
-                types[self.__items[k].type] = {
-                    "size": self.__items[k].size(),
-                    "model": self.__items[k].model,
-                }
-        for k in types.keys():
-            s += f"\n{types[k]['model']} : {types[k]['size']}"
+                types[item.type] = {"size": item.size(), "model": item.model}
+        for item_type in types.values():
+            s += f"\n{item_type['model']} : {item_type['size']}"
         return s
 
     def add_item(self, item):
@@ -79,29 +79,30 @@ class Inventory:
 
         .. warning:: if you try to add more than one item with the same name (or if the
             name is empty), this function will automatically change the name of the item
-            by adding a UUID to it.
+            by adding a number to it.
 
         """
         if isinstance(item, BoardItem):
             if item.pickable():
-                if (
-                    item.name is None
-                    or item.name == ""
-                    or item.name in self.__items.keys()
-                ):
-                    item.name += "_" + uuid.uuid4().hex
-                if (
-                    hasattr(item, "_size")
-                    and self.max_size >= self.size() + item.size()
-                ):
+                if not item.name or item.name in self.__items:
+                    # Make the name unique by adding the next free number to it.
+                    prefix = item.name or item.type
+                    name = f"{prefix}_{self._name_counter}"
+                    while name in self.__items:
+                        self._name_counter += 1
+                        name = f"{prefix}_{self._name_counter}"
+                    self._name_counter += 1
+                    item.name = name
+                if hasattr(item, "_size") and self.max_size >= self._size + item.size():
                     self.__items[item.name] = item
+                    self._size += item.size()
                 else:
                     raise HacInventoryException(
                         "not_enough_space",
                         "There is not enough space left in the inventory. Max. size: "
                         + str(self.max_size)
                         + ", current inventory size: "
-                        + str(self.size())
+                        + str(self._size)
                         + " and item size: "
                         + str(item.size()),
                     )
@@ -130,11 +131,7 @@ class Inventory:
             print(f"Inventory: {mygame.player.inventory.size()}/"
             "{mygame.player.inventory.max_size}")
         """
-        val = 0
-        for k in self.__items.keys():
-            if hasattr(self.__items[k], "size"):
-                val += self.__items[k].size()
-        return val
+        return self._size
 
     def empty(self):
         """Empty the inventory
@@ -144,6 +141,7 @@ class Inventory:
                 inventory.empty()
         """
         self.__items = {}
+        self._size = 0
 
     def value(self):
         """
@@ -159,11 +157,9 @@ class Inventory:
                 print('Victory!')
                 break
         """
-        val = 0
-        for k in self.__items.keys():
-            if hasattr(self.__items[k], "value"):
-                val += self.__items[k].value
-        return val
+        return sum(
+            item.value for item in self.__items.values() if hasattr(item, "value")
+        )
 
     def items_name(self):
         """Return the list of all items names in the inventory.
@@ -214,7 +210,7 @@ class Inventory:
             changed in the inventory. The item hasn't been removed.
 
         """
-        if name in self.__items.keys():
+        if name in self.__items:
             return self.__items[name]
         else:
             raise HacInventoryException(
@@ -241,7 +237,8 @@ class Inventory:
                 mygame.player.inventory.delete_item('heart_1')
 
         """
-        if name in self.__items.keys():
+        if name in self.__items:
+            self._size -= self.__items[name].size()
             del self.__items[name]
         else:
             raise HacInventoryException(
@@ -30,6 +30,39 @@ CYAN_SQUARE = Back.CYAN + "  " + Style.RESET_ALL
 RED_BLUE_SQUARE = Back.RED + " " + Back.BLUE + " " + Style.RESET_ALL
 YELLOW_CYAN_SQUARE = Back.YELLOW + " " + Back.CYAN + " " + Style.RESET_ALL
 
+# Precomputed prefixes for the colored functions. Building them once at import time
+# saves a few string concatenations and colorama attribute lookups on each call.
+_RESET = Style.RESET_ALL
+_GREEN = Fore.GREEN
+_BLUE = Fore.BLUE
+_RED = Fore.RED
+_YELLOW = Fore.YELLOW
+_MAGENTA = Fore.MAGENTA
+_CYAN = Fore.CYAN
+_WHITE = Fore.WHITE
+_BLACK = Fore.BLACK
+_GREEN_BRIGHT = Fore.GREEN + Style.BRIGHT
+_BLUE_BRIGHT = Fore.BLUE + Style.BRIGHT
+_RED_BRIGHT = Fore.RED + Style.BRIGHT
+_YELLOW_BRIGHT = Fore.YELLOW + Style.BRIGHT
+_MAGENTA_BRIGHT = Fore.MAGENTA + Style.BRIGHT
+_CYAN_BRIGHT = Fore.CYAN + Style.BRIGHT
+_WHITE_BRIGHT = Fore.WHITE + Style.BRIGHT
+_BLACK_BRIGHT = Fore.BLACK + Style.BRIGHT
+_GREEN_DIM = Fore.GREEN + Style.DIM
+_BLUE_DIM = Fore.BLUE + Style.DIM
+_RED_DIM = Fore.RED + Style.DIM
+_YELLOW_DIM = Fore.YELLOW + Style.DIM
+_MAGENTA_DIM = Fore.MAGENTA + Style.DIM
+_CYAN_DIM = Fore.CYAN + Style.DIM
+_WHITE_DIM = Fore.WHITE + Style.DIM
+_BLACK_DIM = Fore.BLACK + Style.DIM
+_WARN_PREFIX = Fore.BLACK + Back.YELLOW + "WARNING" + Style.RESET_ALL + ": "
+_FATAL_PREFIX = Fore.WHITE + Back.RED + Style.BRIGHT + "FATAL" + Style.RESET_ALL + ": "
+_INFO_PREFIX = Fore.WHITE + Back.BLUE + "INFO" + Style.RESET_ALL + ": "
+_DEBUG_PREFIX = Fore.BLUE + Back.GREEN + Style.BRIGHT + "DEBUG" + Style.RESET_ALL + ": "
+_WHITE_ON_RED = Fore.WHITE + Back.RED
+
 # get clear sequence for the terminal
 # TODO: check OS
 _exitcode, clear_sequence = subprocess.getstatusoutput("tput clear")
@@ -96,7 +129,7 @@ def warn(message):
 
         Utils.warn("This is a warning.")
     """
-    print(Fore.BLACK + Back.YELLOW + "WARNING" + Style.RESET_ALL + ": " + message)
+    sys.stdout.write(f"{_WARN_PREFIX}{message}\n")
 
 
 def fatal(message):
@@ -112,15 +145,7 @@ def fatal(message):
 
         Utils.fatal("|x_x|")
     """
-    print(
-        Fore.WHITE
-        + Back.RED
-        + Style.BRIGHT
-        + "FATAL"
-        + Style.RESET_ALL
-        + ": "
-        + message
-    )
+    sys.stdout.write(f"{_FATAL_PREFIX}{message}\n")
 
 
 def info(message):
@@ -135,7 +160,7 @@ def info(message):
 
         Utils.info("This is a very informative message.")
     """
-    print(Fore.WHITE + Back.BLUE + "INFO" + Style.RESET_ALL + ": " + message)
+    sys.stdout.write(f"{_INFO_PREFIX}{message}\n")
 
 
 def debug(message):
@@ -151,15 +176,7 @@ def debug(message):
 
         Utils.debug("This is probably going to success, eventually...")
     """
-    print(
-        Fore.BLUE
-        + Back.GREEN
-        + Style.BRIGHT
-        + "DEBUG"
-        + Style.RESET_ALL
-        + ": "
-        + message
-    )
+    sys.stdout.write(f"{_DEBUG_PREFIX}{message}\n")
 
 
 def print_white_on_red(message):
@@ -172,7 +189,7 @@ def print_white_on_red(message):
 
         Utils.print_white_on_red("This is bright!")
     """
-    print(Fore.WHITE + Back.RED + message + Style.RESET_ALL)
+    sys.stdout.write(f"{_WHITE_ON_RED}{message}{_RESET}\n")
 
 
 # Colored bright functions
@@ -190,56 +207,56 @@ def green_bright(message):
         print( Utils.green_bright("This is a formatted message") )
 
     """
-    return Fore.GREEN + Style.BRIGHT + message + Style.RESET_ALL
+    return f"{_GREEN_BRIGHT}{message}{_RESET}"
 
 
 def blue_bright(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.BLUE + Style.BRIGHT + message + Style.RESET_ALL
+    return f"{_BLUE_BRIGHT}{message}{_RESET}"
 
 
 def red_bright(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.RED + Style.BRIGHT + message + Style.RESET_ALL
+    return f"{_RED_BRIGHT}{message}{_RESET}"
 
 
 def yellow_bright(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.YELLOW + Style.BRIGHT + message + Style.RESET_ALL
+    return f"{_YELLOW_BRIGHT}{message}{_RESET}"
 
 
 def magenta_bright(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.MAGENTA + Style.BRIGHT + message + Style.RESET_ALL
+    return f"{_MAGENTA_BRIGHT}{message}{_RESET}"
 
 
 def cyan_bright(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.CYAN + Style.BRIGHT + message + Style.RESET_ALL
+    return f"{_CYAN_BRIGHT}{message}{_RESET}"
 
 
 def white_bright(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.WHITE + Style.BRIGHT + message + Style.RESET_ALL
+    return f"{_WHITE_BRIGHT}{message}{_RESET}"
 
 
 def black_bright(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.BLACK + Style.BRIGHT + message + Style.RESET_ALL
+    return f"{_BLACK_BRIGHT}{message}{_RESET}"
 
 
 # Colored normal functions
@@ -247,56 +264,56 @@ def green(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.GREEN + message + Style.RESET_ALL
+    return f"{_GREEN}{message}{_RESET}"
 
 
 def blue(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.BLUE + message + Style.RESET_ALL
+    return f"{_BLUE}{message}{_RESET}"
 
 
 def red(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.RED + message + Style.RESET_ALL
+    return f"{_RED}{message}{_RESET}"
 
 
 def yellow(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.YELLOW + message + Style.RESET_ALL
+    return f"{_YELLOW}{message}{_RESET}"
 
 
 def magenta(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.MAGENTA + message + Style.RESET_ALL
+    return f"{_MAGENTA}{message}{_RESET}"
 
 
 def cyan(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.CYAN + message + Style.RESET_ALL
+    return f"{_CYAN}{message}{_RESET}"
 
 
 def white(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.WHITE + message + Style.RESET_ALL
+    return f"{_WHITE}{message}{_RESET}"
 
 
 def black(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.BLACK + message + Style.RESET_ALL
+    return f"{_BLACK}{message}{_RESET}"
 
 
 # Colored dim function
@@ -304,56 +321,56 @@ def green_dim(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.GREEN + Style.DIM + message + Style.RESET_ALL
+    return f"{_GREEN_DIM}{message}{_RESET}"
 
 
 def blue_dim(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.BLUE + Style.DIM + message + Style.RESET_ALL
+    return f"{_BLUE_DIM}{message}{_RESET}"
 
 
 def red_dim(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.RED + Style.DIM + message + Style.RESET_ALL
+    return f"{_RED_DIM}{message}{_RESET}"
 
 
 def yellow_dim(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.YELLOW + Style.DIM + message + Style.RESET_ALL
+    return f"{_YELLOW_DIM}{message}{_RESET}"
 
 
 def magenta_dim(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.MAGENTA + Style.DIM + message + Style.RESET_ALL
+    return f"{_MAGENTA_DIM}{message}{_RESET}"
 
 
 def cyan_dim(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.CYAN + Style.DIM + message + Style.RESET_ALL
+    return f"{_CYAN_DIM}{message}{_RESET}"
 
 
 def white_dim(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.WHITE + Style.DIM + message + Style.RESET_ALL
+    return f"{_WHITE_DIM}{message}{_RESET}"
 
 
 def black_dim(message):
     """
     This method works exactly the way green_bright() work with different color.
     """
-    return Fore.BLACK + Style.DIM + message + Style.RESET_ALL
+    return f"{_BLACK_DIM}{message}{_RESET}"
 
 
 def clear_screen():
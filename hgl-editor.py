@@ -983,7 +983,7 @@ while True:
                 for x in range(0, game.current_board().size[1], 1):
                     for y in range(old_value, game.current_board().size[0], 1):
                         game.current_board()._matrix[x].append(
-                            BoardItemVoid(model=game.current_board().ui_board_void_cell)
+                            game.current_board().generate_void_cell()
                         )
                         is_modified = True
 
@@ -996,9 +996,7 @@ while True:
                 for x in range(old_value, nw, 1):
                     new_array = []
                     for y in range(0, game.current_board().size[0], 1):
-                        new_array.append(
-                            BoardItemVoid(model=game.current_board().ui_board_void_cell)
-                        )
+                        new_array.append(game.current_board().generate_void_cell())
                     game.current_board()._matrix.append(new_array)
                     is_modified = True
 
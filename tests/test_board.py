@@ -1,7 +1,11 @@
 from gamelib.Board import Board
 from gamelib.BoardItem import BoardItem, BoardItemVoid
+from gamelib.Characters import Player
 from gamelib.HacExceptions import HacOutOfBoardBoundException
+from gamelib.Structures import Wall
+import io
 import unittest
+from contextlib import redirect_stdout
 
 
 class TestBoard(unittest.TestCase):
@@ -92,6 +96,24 @@ class TestBoard(unittest.TestCase):
         with self.assertRaises(HacOutOfBoardBoundException) as excinfo:
             self.board.item(15, 15)
         self.assertTrue("out of the board boundaries" in str(excinfo.exception))
+        with self.assertRaises(HacOutOfBoardBoundException):
+            self.board.item(-1, 1)
+        with self.assertRaises(HacOutOfBoardBoundException):
+            self.board.item(1, -1)
+
+    def test_place_item_out_of_bounds(self):
+        self.board = Board(size=[10, 5])
+        for row, column in [(5, 0), (0, 10), (-1, 0), (0, -1)]:
+            with self.assertRaises(HacOutOfBoardBoundException):
+                self.board.place_item(BoardItem(), row, column)
+        self.board.place_item(BoardItem(), 4, 9)
+
+    def test_in_bounds(self):
+        self.board = Board(size=[10, 5])
+        for row, column in [(5, 0), (0, 10), (-1, 0), (0, -1)]:
+            self.assertFalse(self.board.in_bounds(row, column))
+        self.assertTrue(self.board.in_bounds(0, 0))
+        self.assertTrue(self.board.in_bounds(4, 9))
 
     def test_clear_cell(self):
         self.board = Board(
@@ -104,6 +126,64 @@ class TestBoard(unittest.TestCase):
         self.board.clear_cell(1, 1)
         self.assertIsInstance(self.board.item(1, 1), BoardItemVoid)
 
+    def test_get_movables_immovables(self):
+        self.board = Board()
+        players = [Player(name=f"player{i}") for i in range(5)]
+        for i, player in enumerate(players):
+            self.board.place_item(player, 9 - i, i)
+        wall = Wall(type="wall_round")
+        self.board.place_item(wall, 0, 0)
+        self.assertEqual(self.board.get_movables(), players)
+        self.assertEqual(self.board.get_movables(name="player3"), [players[3]])
+        self.assertEqual(self.board.get_immovables(type="round"), [wall])
+        self.board.clear_cell(8, 1)
+        self.board.clear_cell(0, 0)
+        self.assertNotIn(players[1], self.board.get_movables())
+        self.assertEqual(self.board.get_immovables(), [])
+
+    def test_generate_void_cell(self):
+        self.board = Board(ui_board_void_cell=".")
+        void_cell = self.board.generate_void_cell()
+        self.assertIsInstance(void_cell, BoardItemVoid)
+        self.assertEqual(void_cell.model, ".")
+        self.assertEqual(void_cell.parent, self.board)
+        self.assertIsNot(void_cell, self.board.generate_void_cell())
+
+    def test_display(self):
+        self.board = Board(size=[3, 2], ui_borders="*", ui_board_void_cell=".")
+        self.board.place_item(Player(model="@"), 1, 2)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.board.display()
+        self.assertEqual(out.getvalue(), "*****\r\n*...*\r\n*..@*\r\n*****\r\n")
+
+    def test_display_void_cell_update(self):
+        self.board = Board(size=[3, 1], ui_borders="*", ui_board_void_cell=".")
+        self.board.ui_board_void_cell = "_"
+        self.board.place_item(BoardItemVoid(model="x"), 0, 1)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.board.display()
+        self.assertEqual(out.getvalue(), "*****\r\n*___*\r\n*****\r\n")
+
+    def test_display_around(self):
+        self.board = Board(size=[10, 10], ui_borders="*", ui_board_void_cell=".")
+        player = Player(model="@")
+        self.board.place_item(player, 0, 0)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.board.display_around(player, 1, 1)
+        self.assertEqual(out.getvalue(), "***\r\n*@.\r\n*..\r\n")
+        # The top border must be as wide as the rows
+        self.board = Board(size=[20, 15], ui_borders="*", ui_board_void_cell=".")
+        self.board.place_item(player, 0, 11)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.board.display_around(player, 1, 10)
+        lines = out.getvalue().split("\r\n")
+        self.assertEqual(len(lines[0]), 22)
+        self.assertEqual(len(lines[1]), 22)
+
 
 if __name__ == "__main__":
     unittest.main()
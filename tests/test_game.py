@@ -0,0 +1,258 @@
+from gamelib.Animation import Animation
+from gamelib.Game import Game
+from gamelib.Board import Board
+from gamelib.BoardItem import BoardItemVoid
+from gamelib.Characters import Player, NPC
+from gamelib.Movable import Projectile
+from gamelib.Structures import Wall, GenericStructure, GenericActionableStructure
+from gamelib.HacExceptions import (
+    HacException,
+    HacInvalidTypeException,
+    HacInvalidLevelException,
+)
+import gamelib.Constants as Constants
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+
+class TestGame(unittest.TestCase):
+    def test_add_board(self):
+        self.game = Game()
+        self.board = Board()
+        self.game.add_board(1, self.board)
+        self.assertEqual(self.game.get_board(1), self.board)
+        self.assertEqual(self.board.parent, self.game)
+        with self.assertRaises(HacInvalidTypeException):
+            self.game.add_board("1", self.board)
+        with self.assertRaises(HacInvalidTypeException):
+            self.game.add_board(2, "board")
+        with self.assertRaises(HacInvalidTypeException):
+            self.game.get_board(1.0)
+
+    def test_change_level(self):
+        self.game = Game(boards={}, menu={})
+        self.game.player = Player()
+        self.game.add_board(1, Board())
+        self.game.add_board(2, Board(player_starting_position=[2, 3]))
+        self.game.change_level(1)
+        self.assertEqual(self.game.current_level, 1)
+        self.game.change_level(2)
+        self.assertEqual(self.game.current_level, 2)
+        self.assertEqual(self.game.player.pos, [2, 3])
+        self.assertIsInstance(self.game.get_board(1).item(0, 0), BoardItemVoid)
+        self.assertEqual(self.game.current_board(), self.game.get_board(2))
+        self.game.current_level = 1
+        self.assertEqual(self.game.current_board(), self.game.get_board(1))
+        self.game.current_level = 3
+        with self.assertRaises(HacInvalidLevelException):
+            self.game.current_board()
+        self.game.current_level = 2
+        with self.assertRaises(HacInvalidTypeException):
+            self.game.change_level("2")
+        with self.assertRaises(HacInvalidLevelException):
+            self.game.change_level(3)
+
+    def test_invalid_level(self):
+        self.game = Game()
+        self.game.add_board(1, Board())
+        with self.assertRaises(HacInvalidTypeException):
+            self.game.add_npc("1", NPC())
+        with self.assertRaises(HacInvalidTypeException):
+            self.game.actuate_projectiles(1.0)
+        with self.assertRaises(HacInvalidLevelException):
+            self.game.add_projectile(42, Projectile(), 0, 0)
+        with self.assertRaises(HacInvalidLevelException):
+            self.game.actuate_npcs(42)
+        with self.assertRaises(HacInvalidLevelException):
+            self.game.animate_items(42)
+
+    def test_add_npc_random_position(self):
+        self.game = Game()
+        self.board = Board(size=[10, 10])
+        self.game.add_board(1, self.board)
+        for row in range(10):
+            for column in range(10):
+                if (row, column) != (7, 3):
+                    self.board.place_item(Wall(), row, column)
+        npc = NPC()
+        self.game.add_npc(1, npc)
+        self.assertEqual(npc.pos, [7, 3])
+        self.assertEqual(self.board.item(7, 3), npc)
+        with self.assertRaises(HacException):
+            self.game.add_npc(1, NPC())
+
+    def test_remove_npc(self):
+        self.game = Game()
+        self.game.add_board(1, Board())
+        self.game.add_board(2, Board())
+        self.game.current_level = 1
+        npc = NPC()
+        self.game.add_npc(2, npc, 3, 4)
+        self.game.remove_npc(2, npc)
+        self.assertEqual(self.game._boards[2]["npcs"], [])
+        self.assertIsInstance(self.game.get_board(2).item(3, 4), BoardItemVoid)
+
+    def test_actuate_projectiles(self):
+        self.game = Game()
+        self.board = Board(size=[10, 10])
+        self.game.add_board(1, self.board)
+        wall = Wall()
+        self.board.place_item(wall, 3, 3)
+        hits = []
+        proj = Projectile(
+            direction=Constants.DRDOWN,
+            range=4,
+            hit_callback=lambda p, objects, params: hits.append(objects),
+        )
+        self.game.add_projectile(1, proj, 1, 1)
+        self.game.actuate_projectiles(1)
+        self.assertEqual(proj.pos, [2, 2])
+        self.assertEqual(hits, [])
+        self.game.actuate_projectiles(1)
+        self.assertEqual(proj.pos, [2, 2])
+        self.assertEqual(hits, [[wall]])
+        self.game.actuate_projectiles(1)
+        self.assertIsInstance(self.board.item(2, 2), BoardItemVoid)
+        self.assertNotIn(proj, self.game._boards[1]["projectiles"])
+
+    def test_actuate_projectiles_board_edge(self):
+        self.game = Game()
+        self.board = Board(size=[10, 10])
+        self.game.add_board(1, self.board)
+        hits = []
+        proj = Projectile(
+            direction=Constants.UP,
+            range=2,
+            hit_callback=lambda p, objects, params: hits.append(objects),
+        )
+        self.game.add_projectile(1, proj, 0, 4)
+        self.game.actuate_projectiles(1)
+        self.assertEqual(len(hits), 1)
+        self.assertEqual(len(hits[0]), 1)
+        self.assertIsInstance(hits[0][0], BoardItemVoid)
+
+    def test_actuate_projectiles_removes_all_stopped(self):
+        self.game = Game()
+        self.board = Board(size=[10, 10])
+        self.game.add_board(1, self.board)
+        for row in range(3):
+            proj = Projectile()
+            self.game.add_projectile(1, proj, row, 0)
+            proj.actuator.stop()
+        self.game.actuate_projectiles(1)
+        self.assertEqual(self.game._boards[1]["projectiles"], [])
+        for row in range(3):
+            self.assertIsInstance(self.board.item(row, 0), BoardItemVoid)
+
+    def test_animate_items(self):
+        self.game = Game()
+        self.board = Board(size=[10, 10])
+        self.game.add_board(1, self.board)
+        wall = Wall()
+        wall.animation = Animation(frames=["a", "b"], parent=wall)
+        npc = NPC()
+        npc.animation = Animation(frames=["c", "d"], parent=npc)
+        self.board.place_item(wall, 0, 0)
+        self.board.place_item(npc, 1, 1)
+        self.board.place_item(Wall(), 2, 2)
+        self.game.animate_items(1)
+        self.assertEqual(wall.model, "b")
+        self.assertEqual(npc.model, "d")
+        self.game.animate_items(1)
+        self.assertEqual(wall.model, "a")
+        self.assertEqual(npc.model, "c")
+
+    def test_save_board(self):
+        self.game = Game(boards={}, menu={})
+        self.game.player = Player()
+        self.game.add_board(1, Board(name="first"))
+        self.game.add_board(2, Board(name="second", size=[5, 4]))
+        self.game.get_board(2).place_item(Wall(model="\u2588"), 3, 4)
+        self.game.change_level(1)
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "level.json")
+            # The saved board is the one of the level, not the current one.
+            self.game.save_board(2, filename)
+            board = Game(boards={}, menu={}).load_board(filename, 3)
+        self.assertEqual(board.name, "second")
+        self.assertEqual(board.size, [5, 4])
+        self.assertIsInstance(board.item(3, 4), Wall)
+        self.assertEqual(board.item(3, 4).model, "\u2588")
+        self.assertIsInstance(board.item(0, 0), BoardItemVoid)
+
+    def test_save_board_structures(self):
+        self.game = Game(boards={}, menu={})
+        self.game.add_board(1, Board(size=[5, 5]))
+        structure = GenericStructure(value=3)
+        structure.set_restorable(True)
+        structure.set_pickable(True)
+        actionable = GenericActionableStructure()
+        actionable.set_restorable(True)
+        actionable.set_overlappable(True)
+        self.game.get_board(1).place_item(structure, 1, 1)
+        self.game.get_board(1).place_item(actionable, 2, 2)
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "level.json")
+            self.game.save_board(1, filename)
+            board = Game(boards={}, menu={}).load_board(filename, 2)
+        self.assertIsInstance(board.item(1, 1), GenericStructure)
+        self.assertEqual(board.item(1, 1).value, 3)
+        self.assertTrue(board.item(1, 1).restorable())
+        self.assertTrue(board.item(1, 1).pickable())
+        self.assertIsInstance(board.item(2, 2), GenericActionableStructure)
+        self.assertTrue(board.item(2, 2).restorable())
+        self.assertTrue(board.item(2, 2).overlappable())
+
+    def test_display_board(self):
+        self.game = Game()
+        self.game.player = Player()
+        self.game.add_board(1, Board(size=[20, 20]))
+        self.game.change_level(1)
+        board = self.game.current_board()
+        expected = io.StringIO()
+        with redirect_stdout(expected):
+            board.display_around(self.game.player, 2, 3)
+            board.display()
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.game.enable_partial_display = True
+            self.game.partial_display_viewport = [2, 3]
+            self.game.display_board()
+            self.game.partial_display_viewport = None
+            self.game.display_board()
+        self.assertEqual(out.getvalue(), expected.getvalue())
+
+    def test_display_menu(self):
+        self.game = Game(menu={})
+        self.game.add_menu_entry("main", None, "Menu")
+        self.game.add_menu_entry("main", "a", "Left")
+        self.game.add_menu_entry("main", "d", "Right")
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.game.display_menu("main")
+            self.game.display_menu("main", Constants.ORIENTATION_HORIZONTAL, 1)
+        self.assertEqual(
+            out.getvalue(),
+            "Menu\na - Left\nd - Right\nMenu | a - Left | \nd - Right | \n",
+        )
+
+    def test_config(self):
+        self.game = Game()
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "config.json")
+            self.game.create_config("main")
+            self.game.config("main")["speed"] = 2
+            self.game.save_config("main", filename)
+            game = Game()
+            self.assertEqual(game.load_config(filename), {"speed": 2})
+            self.assertEqual(game.config(), {"speed": 2})
+            # A loaded section is not overwritten
+            self.assertIsNone(game.load_config(os.path.join(tmp, "other.json")))
+            self.assertEqual(game.config(), {"speed": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
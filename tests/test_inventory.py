@@ -0,0 +1,58 @@
+from gamelib.Inventory import Inventory
+from gamelib.Structures import Treasure, Wall
+from gamelib.HacExceptions import HacInventoryException
+import unittest
+
+
+class TestInventory(unittest.TestCase):
+    def test_size(self):
+        self.inventory = Inventory(max_size=5)
+        self.inventory.add_item(Treasure(name="gold", size=2, value=10))
+        self.inventory.add_item(Treasure(name="silver", size=1, value=5))
+        self.assertEqual(self.inventory.size(), 3)
+        self.assertEqual(self.inventory.value(), 15)
+        with self.assertRaises(HacInventoryException):
+            self.inventory.add_item(Treasure(name="diamond", size=3))
+        self.assertEqual(self.inventory.size(), 3)
+        self.inventory.delete_item("gold")
+        self.assertEqual(self.inventory.size(), 1)
+        self.inventory.add_item(Treasure(name="diamond", size=3))
+        self.assertEqual(self.inventory.size(), 4)
+        self.inventory.empty()
+        self.assertEqual(self.inventory.size(), 0)
+        self.assertEqual(self.inventory.value(), 0)
+
+    def test_duplicate_names(self):
+        self.inventory = Inventory()
+        first = Treasure(name="coin")
+        second = Treasure(name="coin")
+        nameless = Treasure(name=None, type="gem")
+        self.inventory.add_item(Treasure(name="coin_1"))
+        self.inventory.add_item(first)
+        self.inventory.add_item(second)
+        self.inventory.add_item(nameless)
+        self.assertEqual(first.name, "coin")
+        self.assertEqual(second.name, "coin_2")
+        self.assertEqual(nameless.name, "gem_3")
+        self.assertEqual(self.inventory.get_item("coin_2"), second)
+        self.assertEqual(len(self.inventory.items_name()), 4)
+
+    def test_str(self):
+        self.inventory = Inventory()
+        self.inventory.add_item(Treasure(name="gold", type="coin", model="$", size=2))
+        self.inventory.add_item(Treasure(name="silver", type="coin", model="$"))
+        self.inventory.add_item(Treasure(name="ruby", type="gem", model="*"))
+        self.assertEqual(
+            str(self.inventory),
+            "=============\n= inventory =\n=============\n$ : 3\n* : 1",
+        )
+
+    def test_not_pickable(self):
+        self.inventory = Inventory()
+        with self.assertRaises(HacInventoryException):
+            self.inventory.add_item(Wall())
+        self.assertEqual(self.inventory.size(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
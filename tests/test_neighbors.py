@@ -1,6 +1,8 @@
+from gamelib.Board import Board
 from gamelib.BoardItem import BoardItem, BoardItemVoid
 from gamelib.Game import Game
 from gamelib.Characters import Player
+from gamelib.Structures import Wall
 import gamelib.Constants as Constants
 import unittest
 
@@ -75,6 +77,17 @@ class GameNeighborTestCase(unittest.TestCase):
         actual_board_items = self.game.neighbors(1, self.npc77)
         self.assertSetEqual({self.game.player}, set(actual_board_items))
 
+    def test_neighbors_at_board_edge(self):
+        game = Game()
+        board = Board(size=[5, 5])
+        game.add_board(1, board)
+        game.player = Player(name="player")
+        game.change_level(1)
+        board.place_item(Wall(), 4, 4)
+        board.place_item(Wall(), 0, 4)
+        # The walls on the other side of the board are not neighbors of [0, 0]
+        self.assertEqual([], game.neighbors(1))
+
     def dump_board_items(self):
         h, w = self.board.size
         for y in range(h):
@@ -0,0 +1,43 @@
+import gamelib.Utils as Utils
+from colorama import Fore, Back, Style
+import io
+import unittest
+from contextlib import redirect_stdout
+
+
+class TestUtils(unittest.TestCase):
+    def test_colored_functions(self):
+        self.assertEqual(
+            Utils.green_bright("test"),
+            Fore.GREEN + Style.BRIGHT + "test" + Style.RESET_ALL,
+        )
+        self.assertEqual(
+            Utils.red_dim("test"), Fore.RED + Style.DIM + "test" + Style.RESET_ALL,
+        )
+        self.assertEqual(Utils.blue("test"), Fore.BLUE + "test" + Style.RESET_ALL)
+        self.assertEqual(
+            Utils.black_bright(""), Fore.BLACK + Style.BRIGHT + Style.RESET_ALL
+        )
+
+    def test_messages(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            Utils.warn("test")
+            Utils.info("test")
+        self.assertEqual(
+            out.getvalue(),
+            Fore.BLACK
+            + Back.YELLOW
+            + "WARNING"
+            + Style.RESET_ALL
+            + ": test\n"
+            + Fore.WHITE
+            + Back.BLUE
+            + "INFO"
+            + Style.RESET_ALL
+            + ": test\n",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()